@@ -6,7 +6,7 @@ and Automatic Generation of a Routines File.
 This program does the following:
   • Computes Padé approximants for the function defined by
          k₀h = kh * tanh(kh)
-    via Newton–Raphson, and with the transformation u = √(k₀h).
+    via Halley's method, and with the transformation u = √(k₀h).
     
   • Approximates g(u)=kh_numeric(u²) by a rational function of the form:
          R(u) = u * (p₀ + p₁·v² + ... + p_M·v^(2M)) / (1 + q₁·v² + ... + q_M·v^(2M))
@@ -16,51 +16,142 @@ This program does the following:
   
   • Also outputs a file "pade_routines.txt" containing a function
          def pade2025(k0h, formula):
-    which has an if/elif chain; each branch hard-codes one approximant as a Python expression.
+    which has an if/elif chain; each branch hard-codes one approximant as a Python expression
+    whose polynomials are written out in Horner form.
+
+  • Writes the same approximants as C functions pade2025_N(k0h) (plus a pade2025(k0h, formula)
+    dispatcher and a pade2025_batch(k0h, out, n, formula) array kernel, vectorized with AVX2/FMA
+    when the compiler targets it) to "pade_routines.c"; load_pade_routines_c() compiles it and
+    loads it via ctypes.
   
 See the code below.
 """
 
+import ctypes
 import math
+import os
+import subprocess
 import numpy as np
 import matplotlib.pyplot as plt
-import sympy as sp
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional: fall back to plain Python functions
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    prange = range
 
 # -------------------------------
 # Exact dispersion function (kh_numeric)
 # -------------------------------
-def kh_numeric(k0h, tol=1e-20, max_iter=1000):
+@njit(cache=True, fastmath=True)
+def kh_numeric(k0h, tol=1e-20, max_iter=1000, kh0=None):
     """
     Compute the 'exact' nondimensional wavenumber, kh, by solving
          k₀h = kh * tanh(kh)
-    using Newton–Raphson iteration.
+    using Halley's method (JIT-compiled with numba when available).
+    kh0 optionally overrides the initial guess, e.g. with the solution at a
+    neighbouring k₀h when sweeping a fine grid.
     """
     if k0h == 0:
         return 0.0
-    kh = k0h / math.tanh((6/5)**k0h * math.sqrt(k0h))  # initial guess
+    if kh0 is None:
+        kh = k0h / math.tanh((6/5)**k0h * math.sqrt(k0h))  # initial guess
+    else:
+        kh = kh0
     for _ in range(max_iter):
-        f = k0h - kh * math.tanh(kh)
-        df = -math.tanh(kh) - kh / math.cosh(kh) ** 2
-        dkh = f / df
+        t = math.tanh(kh)
+        s2 = 1.0 - t * t  # sech² = 1 - tanh²
+        f = k0h - kh * t
+        df = -t - kh * s2
+        d2f = 2.0 * s2 * (kh * t - 1.0)
+        dkh = 2.0 * f * df / (2.0 * df * df - f * d2f)  # Halley step
         kh_new = kh - dkh
-        if abs(dkh / kh) < tol:
+        if abs(dkh) < tol * (1.0 + abs(kh)):
             return kh_new
         kh = kh_new
     return kh
 
+@njit(cache=True, fastmath=True)
+def kh_numeric_sweep(k0h_vals, tol=1e-15):
+    """
+    Solve kh_numeric on a sorted grid of k₀h values one point at a time, warm-starting
+    each solve from the solution at the previous point (Halley then needs only 2-3 steps).
+    """
+    kh_vals = np.empty_like(k0h_vals)
+    prev_kh = 0.0
+    for i in range(k0h_vals.size):
+        if prev_kh == 0.0:  # no usable neighbour yet: fall back to the default guess
+            kh_vals[i] = kh_numeric(k0h_vals[i], tol)
+        else:
+            kh_vals[i] = kh_numeric(k0h_vals[i], tol, kh0=prev_kh)
+        prev_kh = kh_vals[i]
+    return kh_vals
+
+def kh_numeric_vec(k0h, tol=1e-15, max_iter=100, kh0=None):
+    """
+    Vectorized kh_numeric: solve k₀h = kh * tanh(kh) for a whole array of k₀h
+    values at once. Halley's method runs on the array, and entries drop out of
+    the update as soon as they have converged. kh0 optionally supplies the
+    initial guesses (broadcast against k₀h). Scalar input gives a scalar result.
+    """
+    shape = np.shape(k0h)
+    k0h = np.atleast_1d(np.asarray(k0h, dtype=float))  # boolean masks need at least one axis
+    kh = np.zeros_like(k0h)
+    active = k0h != 0
+    if kh0 is None:
+        kh[active] = k0h[active] / np.tanh((6/5)**k0h[active] * np.sqrt(k0h[active]))  # initial guess
+    else:
+        kh[active] = np.broadcast_to(kh0, k0h.shape)[active]
+    for _ in range(max_iter):
+        if not np.any(active):
+            break
+        x, y = k0h[active], kh[active]
+        t = np.tanh(y)
+        s2 = 1.0 - t * t  # sech² = 1 - tanh²
+        f = x - y * t
+        df = -t - y * s2
+        d2f = 2.0 * s2 * (y * t - 1.0)
+        dkh = 2.0 * f * df / (2.0 * df * df - f * d2f)  # Halley step
+        kh[active] = y - dkh
+        active[active] = np.abs(dkh) >= tol * (1.0 + np.abs(y))
+    return kh.reshape(shape)[()]
+
 # -------------------------------
 # Compute Padé approximant coefficients (with rescaled domain)
 # -------------------------------
-def compute_pade_coeffs(requested_degree, num_points=300):
+def pade_fit_nodes(num_points=300):
+    """
+    Return the Chebyshev nodes v ∈ [0, 1] used by the least-squares fit and the
+    exact values g(u) = kh_numeric(u²) there, with u = √(2π)·v. Both depend only on num_points, so they
+    are computed once and shared by every call to compute_pade_coeffs.
+    """
+    u_max = np.sqrt(2 * math.pi)
+    theta = np.linspace(0, np.pi, num_points)
+    v_vals = 0.5 * (1 - np.cos(theta))  # Chebyshev nodes mapped to [0,1]
+    u_vals = u_max * v_vals             # u = u_max * v, so u ∈ [0, u_max]
+    return v_vals, kh_numeric_vec(u_vals ** 2)
+
+def compute_pade_coeffs(requested_degree, num_points=300, v_vals=None, g_vals=None):
     """
     Fit a Padé approximant of the form:
        R(u) = u · (p₀ + p₁·v² + … + p_M·v^(2M)) / (1 + q₁·v² + … + q_M·v^(2M))
     to approximate g(u) = kh_numeric(u²) for u ∈ [0, uₘₐₓ],
     where uₘₐₓ = √(2π) and v = u/uₘₐₓ ∈ [0,1].
 
+    The fit uses num_points Chebyshev nodes from pade_fit_nodes(). Callers fitting several
+    degrees can compute the nodes once and pass them as v_vals and g_vals, in which case
+    num_points is taken from their length.
     If an even degree is requested, it is reduced by one.
     Here, used_degree = 2M+1 and we solve for x = [p₀, …, p_M, q₁, …, q_M].
 
+    The system is solved by SVD (numpy.linalg.lstsq) after column scaling. From used degree
+    21 on it is numerically rank deficient, and the published coefficients of those formulas
+    are the SVD solution with its default rcond cutoff: a QR solver or a better conditioned
+    basis gives a different (if more accurate) fit, so neither is used here.
+
     Returns:
       requested_degree, used_degree, p (numpy array, length M+1), q (numpy array, length M)
     """
@@ -68,21 +159,20 @@ def compute_pade_coeffs(requested_degree, num_points=300):
     used_degree = requested_degree if requested_degree % 2 == 1 else requested_degree - 1
     M = (used_degree - 1) // 2  # so that used_degree = 2M + 1
 
-    # Use Chebyshev nodes for v in [0,1]:
-    theta = np.linspace(0, np.pi, num_points)
-    v_vals = 0.5 * (1 - np.cos(theta))  # Chebyshev nodes mapped to [0,1]
-    u_vals = u_max * v_vals             # u = u_max * v, so u ∈ [0, u_max]
-    g_vals = np.array([kh_numeric(u ** 2) for u in u_vals])
-    
+    if v_vals is None or g_vals is None:
+        v_vals, g_vals = pade_fit_nodes(num_points)
+    num_points = len(v_vals)
+    u_vals = u_max * v_vals  # u = u_max * v, so u ∈ [0, u_max]
+
+    # Powers v^(2j), built once and shared by the numerator and denominator columns.
+    v2j = (v_vals * v_vals)[:, None] ** np.arange(M + 1)  # shape (num_points, M+1)
+
     # Build the design matrix A and right-hand side b.
-    A = np.zeros((num_points, 2 * M + 1))
-    for i, v in enumerate(v_vals):
-        # Numerator part: columns 0 to M (for p₀ ... p_M)
-        for j in range(M + 1):
-            A[i, j] = u_max * (v ** (2 * j + 1))
-        # Denominator part: columns M + 1 to 2 * M (for q₁ ... q_M)
-        for k in range(1, M + 1):
-            A[i, M + k] = -g_vals[i] * (v ** (2 * k))
+    A = np.empty((num_points, 2 * M + 1))
+    # Numerator part: columns 0 to M (for p₀ ... p_M)
+    A[:, :M + 1] = u_vals[:, None] * v2j
+    # Denominator part: columns M + 1 to 2 * M (for q₁ ... q_M)
+    A[:, M + 1:] = -g_vals[:, None] * v2j[:, 1:]
     b = g_vals.copy()
 
     # --- Column scaling to improve conditioning ---
@@ -99,6 +189,7 @@ def compute_pade_coeffs(requested_degree, num_points=300):
 # -------------------------------
 # Evaluate the Padé approximant with rescaled domain
 # -------------------------------
+@njit(cache=True, fastmath=True)
 def pade_approximation(k0h, p, q):
     """
     Evaluate the Padé approximant for a given k0h.
@@ -106,19 +197,123 @@ def pade_approximation(k0h, p, q):
        u = √(k0h) and v = u/√(2π),
     the approximant is:
        R(u) = u · (p₀ + p₁·v² + ... + p_M·v^(2M)) / (1 + q₁·v² + ... + q_M·v^(2M))
+    Both polynomials are evaluated in w = v² = k0h/(2π) with Horner's scheme.
+    """
+    w = k0h / (2 * math.pi)  # w = v²
+    num = p[-1]
+    for c in p[-2::-1]:
+        num = num * w + c
+    denom = 0.0
+    for c in q[::-1]:
+        denom = denom * w + c
+    denom = denom * w + 1.0
+    return math.sqrt(k0h) * num / denom  # recall u = √(k0h)
+
+def pade_approximation_vec(k0h, p, q):
     """
-    u_max = math.sqrt(2 * math.pi)
-    u = math.sqrt(k0h)
-    v = u / u_max
-    M = len(p) - 1
-    num = 0.0
-    for j in range(M + 1):
-        num += p[j] * (v ** (2 * j))
-    num *= u_max * v  # recall u_max*v equals u
-    denom = 1.0
-    for k in range(1, M + 1):
-        denom += q[k - 1] * (v ** (2 * k))
-    return num / denom
+    Vectorized pade_approximation: evaluate the Padé approximant on a whole
+    array of k0h values with the same Horner recurrence.
+    """
+    k0h = np.asarray(k0h, dtype=float)
+    w = k0h / (2 * math.pi)  # w = v²
+    num = np.full_like(w, p[-1])
+    for c in p[-2::-1]:
+        num = num * w + c
+    denom = np.zeros_like(w)
+    for c in q[::-1]:
+        denom = denom * w + c
+    denom = denom * w + 1.0
+    return np.sqrt(k0h) * num / denom
+
+@njit(parallel=True, cache=True, fastmath=True)
+def pade_eval_batch(k0h_arr, p, q, out):
+    """
+    Write pade_approximation(k0h_arr[i], p, q) into out[i] for every i,
+    spreading the points over threads when numba is available.
+    """
+    for i in prange(k0h_arr.size):
+        out[i] = pade_approximation(k0h_arr[i], p, q)
+
+def pade_approximation_batch(k0h, P, Q):
+    """
+    Evaluate several Padé approximants on an array of k0h values at once.
+
+    P and Q are (n_series, M_max + 1) arrays holding the zero-padded numerator and
+    denominator coefficients of each series, with Q[:, 0] = 1 (trailing zeros leave
+    Horner's scheme unchanged). Each series is evaluated by the compiled
+    pade_eval_batch kernel into one row of a preallocated output buffer.
+
+    Returns an array of shape (len(k0h), n_series); column s holds
+    pade_approximation_vec(k0h, P[s], Q[s, 1:]).
+    """
+    k0h = np.ascontiguousarray(k0h, dtype=float)
+    out = np.empty((P.shape[0], k0h.size))
+    for s in range(P.shape[0]):
+        pade_eval_batch(k0h, P[s], Q[s, 1:], out[s])
+    return out.T
+
+def horner_expr(coeffs, var):
+    """
+    Return Python source for the polynomial c₀ + c₁·var + … + c_n·var^n in
+    nested Horner form, e.g. "c0 + var*(c1 + var*(c2))".
+    """
+    expr = f"{coeffs[-1]:.15g}"
+    for c in coeffs[-2::-1]:
+        expr = f"{c:.15g} + {var}*({expr})"
+    return expr
+
+def load_exact_vals(k0h_vals, file_name="table_k0h_kh_1000.npy", text_file="table_k0h_kh_1000.txt"):
+    """
+    Return kh_numeric_sweep(k0h_vals), reusing the binary (k0h, kh) table saved by
+    table_k0h_kh_1000.py when it was computed on the same k0h grid.
+    The binary copy is only trusted if it is finite and agrees with the text table written
+    next to it (same shape, values equal to 1e-12); otherwise the values are computed here.
+    """
+    try:
+        table = np.load(file_name)
+        text_table = np.loadtxt(text_file, delimiter=",", skiprows=1)
+        if (table.shape == text_table.shape == (len(k0h_vals), 2)
+                and np.all(np.isfinite(table))
+                and np.allclose(table, text_table, rtol=1e-12, atol=1e-15)
+                and np.allclose(table[:, 0], k0h_vals, rtol=0, atol=1e-12)):
+            return table[:, 1]
+    except (OSError, ValueError, EOFError):  # missing, unreadable or truncated files
+        pass
+    return kh_numeric_sweep(np.asarray(k0h_vals, dtype=float))
+
+def load_pade_routines_c(c_file="pade_routines.c", cc="cc", cflags=("-O3", "-funroll-loops"), native=False):
+    """
+    Compile the generated C routines into a shared library (unless an up-to-date
+    one exists next to c_file) and load it with ctypes. The returned library
+    exposes pade2025_N(k0h) for each formula N, the pade2025(k0h, formula) dispatcher
+    and pade2025_batch(k0h, out, n, formula), which fills the float64 array out with
+    the approximant at the n values of the contiguous float64 array k0h (returns -1
+    for an unknown formula, 0 otherwise).
+    The default cflags build a library that runs on any machine of the same architecture.
+    native=True opts in to -march=native -ffast-math, which enables the AVX2/FMA path of
+    pade2025_batch on CPUs that have it and lets the compiler fuse and reorder the Horner steps
+    (the approximants are unaffected beyond rounding); that library only runs on the build CPU
+    and gets its own file name, so the two builds never replace each other.
+    """
+    if native:
+        cflags = (*cflags, "-march=native", "-ffast-math")
+    lib_file = (os.path.splitext(os.path.abspath(c_file))[0] + ("_native" if native else "")
+                + (".dll" if os.name == "nt" else ".so"))
+    if not os.path.exists(lib_file) or os.path.getmtime(lib_file) < os.path.getmtime(c_file):
+        subprocess.run([cc, *cflags, "-shared", "-fPIC", "-o", lib_file, c_file, "-lm"], check=True)
+    lib = ctypes.CDLL(lib_file)
+    lib.pade2025.restype = ctypes.c_double
+    lib.pade2025.argtypes = [ctypes.c_double, ctypes.c_int]
+    double_array = np.ctypeslib.ndpointer(dtype=np.float64, flags="C_CONTIGUOUS")
+    lib.pade2025_batch.restype = ctypes.c_int
+    lib.pade2025_batch.argtypes = [double_array, double_array, ctypes.c_size_t, ctypes.c_int]
+    n = 1
+    while hasattr(lib, f"pade2025_{n}"):
+        func = getattr(lib, f"pade2025_{n}")
+        func.restype = ctypes.c_double
+        func.argtypes = [ctypes.c_double]
+        n += 1
+    return lib
 
 # -------------------------------
 # Main driver
@@ -126,25 +321,38 @@ def pade_approximation(k0h, p, q):
 def main():
     # Define full domain: k₀h in [0, 2π]
     k0h_vals = np.linspace(0, 2 * math.pi, 1000)
-    exact_vals = np.array([kh_numeric(val) for val in k0h_vals])
+    exact_vals = load_exact_vals(k0h_vals)
 
-    # Compute approximants for requested degrees.
-    unique_results = {}
-    requested_degrees = list(range(5, 31))
+    # Compute approximants for requested degrees, sharing one set of fitting nodes.
+    v_nodes, g_nodes = pade_fit_nodes(num_points=300)
+    unique_fits = {}
+    requested_degrees = list(range(5, 31, 2))  # even degrees reduce to the previous odd one
     for deg in requested_degrees:
-        req_deg, used_deg, p, q = compute_pade_coeffs(deg, num_points=300)
-        if used_deg not in unique_results:
-            approx_vals = np.array([pade_approximation(val, p, q) for val in k0h_vals])
-            with np.errstate(divide='ignore', invalid='ignore'):
-                rel_errors = np.where(np.abs(exact_vals) > 1e-12,
-                                      np.abs(approx_vals - exact_vals) / np.abs(exact_vals),
-                                      0.0)
-            avg_err = np.mean(rel_errors)
-            max_err = np.max(rel_errors)
-            unique_results[used_deg] = (req_deg, used_deg, p, q, avg_err, max_err, approx_vals)
-
-    # Convert dictionary to a list for later processing.
-    series_results = list(unique_results.values())
+        # Check for a duplicate used degree before running the least-squares fit.
+        used_deg = deg if deg % 2 == 1 else deg - 1
+        if used_deg not in unique_fits:
+            unique_fits[used_deg] = compute_pade_coeffs(deg, v_vals=v_nodes, g_vals=g_nodes)
+    fits = list(unique_fits.values())
+
+    # Store the series as parallel arrays: row s of P and Q holds the coefficients
+    # of series s, zero-padded to M_max + 1 entries (with Q[:, 0] = 1).
+    n_series = len(fits)
+    req_degs = np.array([fit[0] for fit in fits])
+    used_degs = np.array([fit[1] for fit in fits])
+    Ms = (used_degs - 1) // 2
+    P = np.zeros((n_series, Ms.max() + 1))
+    Q = np.zeros((n_series, Ms.max() + 1))
+    Q[:, 0] = 1.0
+    for s, (_, _, p, q) in enumerate(fits):
+        P[s, :len(p)] = p
+        Q[s, 1:len(q) + 1] = q
+
+    # Evaluate all approximants together; column s of approx_all belongs to series s.
+    approx_all = pade_approximation_batch(k0h_vals, P, Q)
+    abs_exact = np.abs(exact_vals)[:, None]
+    rel_errors_all = np.abs(approx_all - exact_vals[:, None]) / np.where(abs_exact > 1e-12, abs_exact, 1.0)
+    avg_errs = rel_errors_all.mean(axis=0)
+    max_errs = rel_errors_all.max(axis=0)
 
     # Write a detailed report to pade_output.txt
     with open("pade_output.txt", "w", encoding="utf-8") as f:
@@ -152,36 +360,34 @@ def main():
         f.write("Fitting is performed for k₀h in [0, 2π] with u = √(k₀h) and v = u/√(2π) ∈ [0,1]\n")
         f.write("The Padé approximant is of the form:\n")
         f.write("   R(u) = u · (p₀ + p₁·v² + ... + p_M·v^(2M)) / (1 + q₁·v² + ... + q_M·v^(2M))\n\n")
-        for req_deg, used_deg, p, q, avg_err, max_err, _ in series_results:
-            f.write(f"Requested Degree: {req_deg}   (Used Degree: {used_deg})\n")
+        for s in range(n_series):
+            f.write(f"Requested Degree: {req_degs[s]}   (Used Degree: {used_degs[s]})\n")
             f.write("Numerator coefficients (for u_max*v^(2j+1) terms):\n")
-            for j, coeff in enumerate(p):
+            for j, coeff in enumerate(P[s, :Ms[s] + 1]):
                 f.write(f"  Coefficient for v^{2*j} : {coeff:.12e}\n")
             f.write("Denominator coefficients (for v^(2k) terms, k>=1):\n")
-            for k, coeff in enumerate(q, start=1):
+            for k, coeff in enumerate(Q[s, 1:Ms[s] + 1], start=1):
                 f.write(f"  Coefficient for v^{2*k} : {coeff:.12e}\n")
-            f.write(f"Average relative error: {avg_err*100:.6e} %\n")
-            f.write(f"Maximum relative error: {max_err*100:.6e} %\n")
+            f.write(f"Average relative error: {avg_errs[s]*100:.6e} %\n")
+            f.write(f"Maximum relative error: {max_errs[s]*100:.6e} %\n")
             f.write("-" * 60 + "\n")
 
         # Detailed table with 50 sample points
         f.write("\n=== Detailed Sample Evaluation (50 sample points) ===\n")
         header = "k0h".ljust(10) + "Exact kh".ljust(15)
-        for req_deg, used_deg, _, _, _, _, _ in series_results:
+        for req_deg in req_degs:
             header += f"Pade(Deg {req_deg})".ljust(20) + f"RelErr({req_deg})".ljust(15)
         f.write(header + "\n")
         f.write("-" * len(header) + "\n")
 
         sample_indices = np.linspace(0, len(k0h_vals) - 1, 50, dtype=int)
-        for idx in sample_indices:
-            line = f"{k0h_vals[idx]:<10.4f}" + f"{exact_vals[idx]:<15.6f}"
-            for req_deg, used_deg, p, q, _, _, _ in series_results:
-                approx_val = pade_approximation(k0h_vals[idx], p, q)
-                exact_val = kh_numeric(k0h_vals[idx])
-                rel_err = (abs(approx_val - exact_val) / abs(exact_val) * 100 
-                           if abs(exact_val) > 1e-12 else 0.0)
-                line += f"{approx_val:<20.6f}" + f"{rel_err:<15.6f}"
-            f.write(line + "\n")
+        # One row per sample: k0h, exact kh, then (approximation, relative error in %) per series.
+        table = np.empty((len(sample_indices), 2 + 2 * n_series))
+        table[:, 0] = k0h_vals[sample_indices]
+        table[:, 1] = exact_vals[sample_indices]
+        table[:, 2::2] = approx_all[sample_indices]
+        table[:, 3::2] = rel_errors_all[sample_indices] * 100
+        np.savetxt(f, table, fmt="%-10.4f%-15.6f" + "%-20.6f%-15.6f" * n_series)
 
     # Output pade_routines.txt containing a single function pade2025()
     with open("pade_routines.txt", "w", encoding="utf-8") as f:
@@ -190,52 +396,93 @@ def main():
         f.write('    """\n')
         f.write("    Parameters:\n")
         f.write("      k0h    : Nondimensional deep-water parameter.\n")
-        f.write(f"      formula: Integer (1 to {len(series_results)}) specifying which formula to use.\n")
+        f.write(f"      formula: Integer (1 to {n_series}) specifying which formula to use.\n")
         f.write("    Returns:\n")
         f.write("      Approximated nondimensional wavenumber, kh.\n")
         f.write('    """\n')
 
-        # Write the if/elif chain using the unique series_results.
-        for idx, result in enumerate(series_results, start=1):
-            req_deg, used_deg, p, q, avg_err, max_err, _ = result
+        # Write the if/elif chain, one branch per series.
+        for idx in range(1, n_series + 1):
+            p, q = P[idx - 1, :Ms[idx - 1] + 1], Q[idx - 1, 1:Ms[idx - 1] + 1]
             if idx == 1:
                 f.write("    if formula == 1:\n")
             else:
                 f.write(f"    elif formula == {idx}:\n")
 
-            M = len(p) - 1
-            
-            # Create sympy symbols
-            k0h_sym = sp.Symbol('k0h')
-            u_max = math.sqrt(2 * math.pi)
-            v_sym = k0h_sym**0.5 / u_max  # v = sqrt(k0h) / sqrt(2π)
-
-            # Build pure polynomial numerators and denominators
-            num_expr = sum(coef * (v_sym**(2*j)) for j, coef in enumerate(p))
-            denom_expr = 1 + sum(coef * (v_sym**(2*k)) for k, coef in enumerate(q, start=1))
-
-            # Convert to plain polynomial expressions in terms of k0h
-            num_expr = sp.simplify(num_expr * (k0h_sym**0.5))  # Include u as part of the numerator
-            denom_expr = sp.simplify(denom_expr)
+            # Rescale from powers of v² = k0h/(2π) to powers of k0h.
+            scale = (2 * math.pi) ** -np.arange(len(p))
+            num_expr = horner_expr(p * scale, "k0h")
+            denom_expr = horner_expr(np.concatenate(([1.0], q)) * scale, "k0h")
 
-            # Format for output
-            formatted_num_expr = sp.expand(num_expr)
-            formatted_denom_expr = sp.expand(denom_expr)
-
-            f.write(f"        return ( ({formatted_num_expr}) ) / ( ({formatted_denom_expr}) )\n")
+            f.write(f"        return math.sqrt(k0h) * ({num_expr}) / ({denom_expr})\n")
 
         f.write("    else:\n")
         f.write("        return -1\n")
 
+    # Output pade_routines.c with the same approximants as C functions (Horner form in w = k0h/(2π)).
+    with open("pade_routines.c", "w", encoding="utf-8") as f:
+        f.write("/* Padé approximants of kh(k0h) generated by pade_approximants.py. */\n")
+        f.write("#include <math.h>\n")
+        f.write("#include <stddef.h>\n")
+        f.write("#if defined(__AVX2__) && defined(__FMA__)\n#include <immintrin.h>\n#endif\n\n")
+        for idx in range(1, n_series + 1):
+            p, q = P[idx - 1, :Ms[idx - 1] + 1], Q[idx - 1, 1:Ms[idx - 1] + 1]
+            f.write(f"/* Degree {used_degs[idx - 1]}: max relative error {max_errs[idx - 1]*100:.2e} % */\n")
+            # Coefficient tables (ascending powers of w) for pade2025_batch().
+            f.write(f"static const double pade2025_num_{idx}[] = {{{', '.join(f'{c:.17g}' for c in p)}}};\n")
+            f.write(f"static const double pade2025_den_{idx}[] = {{1.0, {', '.join(f'{c:.17g}' for c in q)}}};\n")
+            f.write(f"double pade2025_{idx}(double k0h)\n{{\n")
+            f.write("    double w = k0h * 0.15915494309189535; /* k0h / (2*pi) */\n")
+            f.write(f"    double n = {p[-1]:.17g};\n")
+            for c in p[-2::-1]:
+                f.write(f"    n = n * w + {c:.17g};\n")
+            f.write("    double d = 0.0;\n")
+            for c in q[::-1]:
+                f.write(f"    d = d * w + {c:.17g};\n")
+            f.write("    d = d * w + 1.0;\n")
+            f.write("    return sqrt(k0h) * n / d;\n}\n\n")
+        f.write("double pade2025(double k0h, int formula)\n{\n")
+        f.write("    switch (formula)\n    {\n")
+        for idx in range(1, n_series + 1):
+            f.write(f"    case {idx}: return pade2025_{idx}(k0h);\n")
+        f.write("    default: return -1;\n    }\n}\n\n")
+
+        # Array kernel: with AVX2/FMA, four k0h values share each Horner step (one fused
+        # multiply-add per polynomial); the remaining values go through the scalar functions.
+        f.write(f"static const double *const pade2025_num[] = {{{', '.join(f'pade2025_num_{i}' for i in range(1, n_series + 1))}}};\n")
+        f.write(f"static const double *const pade2025_den[] = {{{', '.join(f'pade2025_den_{i}' for i in range(1, n_series + 1))}}};\n")
+        f.write(f"static const int pade2025_deg[] = {{{', '.join(str(M) for M in Ms)}}};\n\n")
+        f.write("int pade2025_batch(const double *k0h, double *out, size_t n, int formula)\n{\n")
+        f.write(f"    if (formula < 1 || formula > {n_series})\n        return -1;\n")
+        f.write("    size_t i = 0;\n")
+        f.write("#if defined(__AVX2__) && defined(__FMA__)\n")
+        f.write("    const double *p = pade2025_num[formula - 1], *q = pade2025_den[formula - 1];\n")
+        f.write("    const int m = pade2025_deg[formula - 1];\n")
+        f.write("    const __m256d scale = _mm256_set1_pd(0.15915494309189535); /* 1 / (2*pi) */\n")
+        f.write("    for (; i + 4 <= n; i += 4)\n    {\n")
+        f.write("        __m256d x = _mm256_loadu_pd(k0h + i);\n")
+        f.write("        __m256d w = _mm256_mul_pd(x, scale);\n")
+        f.write("        __m256d num = _mm256_set1_pd(p[m]);\n")
+        f.write("        __m256d den = _mm256_set1_pd(q[m]);\n")
+        f.write("        for (int j = m - 1; j >= 0; j--)\n        {\n")
+        f.write("            num = _mm256_fmadd_pd(num, w, _mm256_set1_pd(p[j]));\n")
+        f.write("            den = _mm256_fmadd_pd(den, w, _mm256_set1_pd(q[j]));\n")
+        f.write("        }\n")
+        f.write("        _mm256_storeu_pd(out + i, _mm256_div_pd(_mm256_mul_pd(_mm256_sqrt_pd(x), num), den));\n")
+        f.write("    }\n#endif\n")
+        f.write("    for (; i < n; i++)\n        out[i] = pade2025(k0h[i], formula);\n")
+        f.write("    return 0;\n}\n")
+
     # -------------------------------
     # Plotting the approximants against the exact solution.
     # -------------------------------
     plt.figure(figsize=(10, 6))
     plt.plot(k0h_vals, exact_vals, 'k-', linewidth=2, label='kh_numeric (exact)')
-    colors = plt.cm.plasma(np.linspace(0, 1, len(series_results)))
-    for (req_deg, used_deg, p, q, avg_err, max_err, approx_vals), col in zip(series_results, colors):
-        label_str = f"Req Deg {req_deg} (used {used_deg}): avg err {avg_err*100:.2e}%, max err {max_err*100:.2e}%"
-        plt.plot(k0h_vals, approx_vals, '-', color=col, label=label_str)
+    colors = plt.cm.plasma(np.linspace(0, 1, n_series))
+    for s, col in enumerate(colors):
+        label_str = (f"Req Deg {req_degs[s]} (used {used_degs[s]}): "
+                     f"avg err {avg_errs[s]*100:.2e}%, max err {max_errs[s]*100:.2e}%")
+        plt.plot(k0h_vals, approx_all[:, s], '-', color=col, label=label_str)
     plt.xlabel("k0h")
     plt.ylabel("kh")
     plt.title("kh_numeric vs. Padé Approximants (Fitted over [0, 2π])")
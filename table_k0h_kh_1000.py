@@ -1,40 +1,72 @@
 import math
+import os
+import numpy as np
 
-def kh_numeric(k0h, tol=1e-30, max_iter=1000):
+try:
+    from numba import njit
+except ImportError:  # numba is optional: fall back to plain Python functions
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+@njit(cache=True, fastmath=True)
+def kh_numeric(k0h, tol=1e-30, max_iter=1000, kh0=None):
     if k0h == 0:
         return 0.0
 
-    # Initial guess using Carvalho's (2006) suggested method.
-    kh = k0h / math.tanh((6 / 5) ** k0h * math.sqrt(k0h))
+    if kh0 is None:
+        # Initial guess using Carvalho's (2006) suggested method.
+        kh = k0h / math.tanh((6 / 5) ** k0h * math.sqrt(k0h))
+    else:
+        # Warm start, e.g. from the solution at the previous point of a sweep.
+        kh = kh0
 
     for _ in range(max_iter):
+        t = math.tanh(kh)
         # f(kh) = k0h - kh * tanh(kh)
-        f = k0h - kh * math.tanh(kh)
-        # Exact derivative: f'(kh) = -tanh(kh) - kh * sech^2(kh)
-        df = -math.tanh(kh) - kh / math.cosh(kh) ** 2
-        # Newton-Raphson update: kh_new = kh - f/df
-        dkh = f / df
+        f = k0h - kh * t
+        # Exact derivatives, with sech^2 = 1 - tanh^2:
+        #   f'(kh)  = -tanh(kh) - kh * sech^2(kh)
+        #   f''(kh) = 2 * sech^2(kh) * (kh * tanh(kh) - 1)
+        s2 = 1.0 - t * t
+        df = -t - kh * s2
+        d2f = 2.0 * s2 * (kh * t - 1.0)
+        # Halley update (cubic convergence): kh_new = kh - 2*f*df / (2*df^2 - f*d2f)
+        dkh = 2.0 * f * df / (2.0 * df * df - f * d2f)
         kh_new = kh - dkh
-        if abs(dkh / kh) < tol:
+        # Stop once |dkh| < tol * (1 + |kh|): relative for large kh, without a division.
+        if abs(dkh) < tol * (1.0 + abs(kh)):
             return kh_new
         kh = kh_new
 
     # Return last computed value if convergence not reached.
     return kh
 
+@njit(cache=True, fastmath=True)
+def kh_numeric_sweep(k0h_values, tol=1e-15):
+    # Solve a sorted grid point by point, warm-starting each solve from the previous
+    # solution: neighbouring kh values are close, so Halley needs only 2-3 steps.
+    kh_values = np.empty_like(k0h_values)
+    prev_kh = 0.0
+    for i in range(k0h_values.size):
+        if prev_kh == 0.0:
+            # No usable neighbour yet (first point or k0h = 0): Carvalho's guess.
+            kh_values[i] = kh_numeric(k0h_values[i], tol)
+        else:
+            kh_values[i] = kh_numeric(k0h_values[i], tol, kh0=prev_kh)
+        prev_kh = kh_values[i]
+    return kh_values
+
 def generate_kh_values(file_name, num_values=1000, k0h_min=0.0, k0h_max=2*math.pi):
-    k0h_values = [k0h_min + i * (k0h_max - k0h_min) / (num_values - 1) for i in range(num_values)]
-    results = []
-    
-    for k0h in k0h_values:
-        kh = kh_numeric(k0h)
-        results.append((k0h, kh))
-    
-    with open(file_name, 'w') as file:
-        # Write the header
-        file.write("k0h, kh\n")
-        for k0h, kh in results:
-            file.write(f"{k0h:.20f}, {kh:.20f}\n")
+    k0h_values = k0h_min + np.arange(num_values) * (k0h_max - k0h_min) / (num_values - 1)
+    # kh_numeric's own tolerance: iterate each point until the Halley step vanishes.
+    kh_values = kh_numeric_sweep(k0h_values, tol=1e-30)
+    # Write the header and all rows in one call; NumPy does the formatting.
+    table = np.column_stack((k0h_values, kh_values))
+    np.savetxt(file_name, table, fmt='%.20f', delimiter=', ', header='k0h, kh', comments='')
+    # Binary copy of the same table, reused by pade_approximants.py as its exact kh values.
+    np.save(os.path.splitext(file_name)[0] + '.npy', table)
 
 # Usage
 output_file = 'table_k0h_kh_1000.txt'
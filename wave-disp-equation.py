@@ -5,7 +5,7 @@ WAVE DISPERSION EQUATION – Linear Gravity Waves (Airy Theory)
 
 This module provides a comprehensive suite of solutions and approximations for analyzing wave dispersion,
 essential for wave prediction, oceanographic calculations, and coastal engineering design. It includes a
-reference "exact" solution using the Newton-Raphson method, classical and contemporary explicit approximations,
+reference "exact" solution using Halley's root-finding method, classical and contemporary explicit approximations,
 and high-order Padé approximants for high precision.
 
 **Background:**
@@ -33,7 +33,7 @@ carefully based on accuracy requirements.
 
 **Module Contents:**
 
-  - Reference "Exact" Solution: kh_numeric() implements the Newton-Raphson iteration method for a
+  - Reference "Exact" Solution: kh_numeric() implements Halley's iteration method (a third-order Newton variant) for a
     highly precise solution of wave dispersion, acting as a benchmark for other techniques.
 
   - Classical Approximations: Established methods from researchers like Hunt, Eckart, Nielsen, and Gilbert.
@@ -93,6 +93,9 @@ from Fenton and colleagues (Fenton & McKee, 1990; Fenton, 1972) and innovative c
 
 """
 
+# Importing argparse to read the command-line options of the script.
+import argparse
+
 # Importing the math module to access mathematical functions like sqrt, sinh, tanh, etc.
 import math
 
@@ -102,17 +105,35 @@ import numpy as np
 # Importing pyplot from matplotlib for data visualization.
 import matplotlib.pyplot as plt
 
-# Importing time module to track the execution time of code or create delays.
-import time
+# Importing Path from pathlib to write the ranking table to a text file.
+from pathlib import Path
+
+# Importing timeit, deque and itertools to measure the execution time of each approximation method.
+import itertools
+import timeit
+from collections import deque
+
+# Importing numba (optional) to JIT-compile the scalar numerical kernels.
+try:
+    from numba import njit, prange, vectorize
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional: fall back to plain Python functions
+    HAVE_NUMBA = False
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    prange = range
 
 # =============================================================================
-# EXACT SOLUTION (NEWTON–RAPHSON) - Reference Implementation
+# EXACT SOLUTION (HALLEY ITERATION) - Reference Implementation
 # =============================================================================
 
-def kh_numeric(k0h, tol=1e-15, max_iter=100):
+@njit(cache=True, fastmath=True)
+def kh_numeric(k0h, tol=1e-15, max_iter=100, kh0=None):
     """
     Compute the 'exact' nondimensional wavenumber *kh* by numerically solving the dispersion
-    relation using the Newton–Raphson method.
+    relation using Halley's method.
 
     **Equation Solved:**
     The nondimensional dispersion relation (derived from Airy wave theory) is:
@@ -120,14 +141,22 @@ def kh_numeric(k0h, tol=1e-15, max_iter=100):
     where k0h = k₀·h (with k₀ = ω²/g) and kh = k·h.
 
     **Method:**
-      - Newton–Raphson iteration:
-            kh_new = kh - f(kh) / f'(kh)
-      - f'(kh) = -tanh(kh) - kh * sech²(kh)
+      - Halley iteration (cubically convergent, one or two steps fewer than Newton–Raphson):
+            kh_new = kh - 2·f·f' / (2·f'² - f·f'')
+      - f'(kh) = -tanh(kh) - kh * sech²(kh) and f''(kh) = 2·sech²(kh)·(kh·tanh(kh) - 1), both
+        evaluated from t = tanh(kh) with sech² = 1 - t², so that each iteration needs a single tanh.
       - Initial guess: kh₀ ≈ k0h / tanh((6/5)^k0h * sqrt(k0h)) (Carvalho, 2006 style).  This initialization provides
         a reasonable starting point and promotes quicker convergence.
+      - Warm start: when `kh0` is given it replaces the initial guess.  Sweeps over a fine,
+        ordered grid of k0h can pass the previous solution and converge in one or two steps.
 
     **Convergence Criteria:**
-      Iteratively adjust *kh* until the relative change |Δkh/kh| is below the tolerance `tol`.
+      Iteratively adjust *kh* until the change satisfies |Δkh| < tol·(1 + |kh|), a relative test
+      for large *kh* that needs no division per iteration.
+
+    **Performance:**
+      The function is JIT-compiled with numba (`njit`, cached on disk) when numba is installed,
+      and runs as plain Python otherwise.
 
     **References:**
       - Fenton & McKee (1990); Yamaguchi & Nonaka (2007); Press et al. (1992).
@@ -136,6 +165,7 @@ def kh_numeric(k0h, tol=1e-15, max_iter=100):
       k0h (float): Nondimensional deep-water parameter (k₀·h).  Must be non-negative.
       tol (float): Relative convergence tolerance (default: 1e-15). Adjust for desired precision.
       max_iter (int): Maximum number of iterations (default: 100). Increase if convergence fails.
+      kh0 (float or None): Optional initial guess overriding the Carvalho (2006) seed (default: None).
 
     **Returns:**
       float: Computed nondimensional wavenumber *kh*. Returns 0.0 if `k0h` is 0.
@@ -143,21 +173,293 @@ def kh_numeric(k0h, tol=1e-15, max_iter=100):
     """
     if k0h == 0:
         return 0.0
-    kh = k0h / math.tanh((6/5)**k0h * math.sqrt(k0h))
+    if kh0 is None:
+        kh = k0h / math.tanh((6/5)**k0h * math.sqrt(k0h))
+    else:
+        kh = kh0
     for _ in range(max_iter):
-        f = k0h - kh * math.tanh(kh)
-        df = -math.tanh(kh) - kh / math.cosh(kh)**2
-        dkh = f / df
+        t = math.tanh(kh)
+        s2 = 1.0 - t * t
+        f = k0h - kh * t
+        df = -t - kh * s2
+        d2f = 2.0 * s2 * (kh * t - 1.0)
+        dkh = 2.0 * f * df / (2.0 * df * df - f * d2f)
         kh_new = kh - dkh
-        if abs(dkh/kh) < tol:
+        if abs(dkh) < tol * (1.0 + abs(kh)):
             return kh_new
         kh = kh_new
     return kh
 
+def kh_numeric_vec(k0h, tol=1e-15, max_iter=100, kh0=None):
+    """
+    Vectorized counterpart of kh_numeric() for NumPy arrays of *k0h*.
+
+    **Method:**
+      The same Halley iteration and initial guess as kh_numeric(), applied to the whole
+      array at once with NumPy ufuncs. The derivatives use sech²(kh) = 1 - tanh²(kh), so each
+      iteration costs a single tanh. Entries leave the update as soon as their change satisfies
+      |Δkh| < tol·(1 + |kh|). (Iterating all entries together for a fixed count instead is no
+      faster: from this seed nearly every entry converges in the same few steps. Nor is a numba
+      @vectorize ufunc over the compiled kh_numeric(), whose scalar tanh calls do not vectorize.)
+
+    **Parameters:**
+      k0h (array_like): Nondimensional deep-water parameters (k₀·h).  Must be non-negative.
+      tol (float): Relative convergence tolerance (default: 1e-15).
+      max_iter (int): Maximum number of iterations (default: 100).
+      kh0 (array_like or None): Optional initial guesses, broadcast against `k0h` (default: None).
+
+    **Returns:**
+      numpy.ndarray: Computed nondimensional wavenumbers *kh*, with 0.0 wherever `k0h` is 0
+      (a NumPy scalar for scalar `k0h`).
+    """
+    shape = np.shape(k0h)
+    k0h = np.atleast_1d(np.asarray(k0h, dtype=float))  # boolean masks need at least one axis
+    kh = np.zeros_like(k0h)
+    active = k0h != 0
+    if kh0 is None:
+        kh[active] = k0h[active] / np.tanh((6/5)**k0h[active] * np.sqrt(k0h[active]))
+    else:
+        kh[active] = np.broadcast_to(kh0, k0h.shape)[active]
+    for _ in range(max_iter):
+        if not np.any(active):
+            break
+        x, y = k0h[active], kh[active]
+        t = np.tanh(y)
+        s2 = 1.0 - t * t
+        f = x - y * t
+        df = -t - y * s2
+        d2f = 2.0 * s2 * (y * t - 1.0)
+        dkh = 2.0 * f * df / (2.0 * df * df - f * d2f)
+        kh[active] = y - dkh
+        active[active] = np.abs(dkh) >= tol * (1.0 + np.abs(y))
+    return kh.reshape(shape)[()]
+
+# Cubic spline of log(kh) against log(k0h), built by kh_numeric_fast() on first use.
+_kh_spline = None
+
+def kh_numeric_fast(k0h, polish=True):
+    """
+    Fast 'exact' *kh* for NumPy arrays of *k0h* from a precomputed inverse table.
+
+    **Method:**
+      On first use, kh_numeric_vec() tabulates *kh* on 4096 log-spaced values of k0h in
+      [1e-8, 100], and a cubic spline is fitted to log(kh) as a function of log(k0h).  Each query
+      then costs a spline lookup, giving a seed with a relative error of about 1e-10, plus a single
+      Halley step of kh_numeric_vec(), which polishes it to double precision.  Outside the
+      tabulated range the asymptotes seed the step: kh ≈ k0h / tanh(√k0h) in shallow water
+      (accurate to about 1e-9 below the table) and kh = k0h in deep water (exact above it).
+      With polish=False the Halley step is skipped and the interpolated values are returned as
+      they are, more than twice as fast, to a relative error of a few 1e-12 in the table.
+
+      The spline comes from scipy, which is imported on first use, so the rest of the module
+      does not depend on it.
+
+    **Parameters:**
+      k0h (array_like): Nondimensional deep-water parameters (k₀·h).  Must be non-negative.
+      polish (bool): Refine the interpolated values with one Halley step (default: True).
+
+    **Returns:**
+      numpy.ndarray: Computed nondimensional wavenumbers *kh*, with 0.0 wherever `k0h` is 0
+      (a NumPy scalar for scalar `k0h`).
+    """
+    global _kh_spline
+    if _kh_spline is None:
+        from scipy.interpolate import CubicSpline
+        k0h_grid = np.logspace(-8, 2, 4096)
+        _kh_spline = CubicSpline(np.log(k0h_grid), np.log(kh_numeric_vec(k0h_grid)))
+    shape = np.shape(k0h)
+    k0h = np.atleast_1d(np.asarray(k0h, dtype=float))  # boolean masks need at least one axis
+    kh0 = k0h.copy()  # above the table tanh(kh) = 1 in double precision, so kh = k0h
+    shallow = (k0h > 0) & (k0h < 1e-8)
+    kh0[shallow] = k0h[shallow] / np.tanh(np.sqrt(k0h[shallow]))
+    in_table = (k0h >= 1e-8) & (k0h <= 1e2)
+    kh0[in_table] = np.exp(_kh_spline(np.log(k0h[in_table])))
+    if not polish:
+        return kh0.reshape(shape)[()]
+    return kh_numeric_vec(k0h, max_iter=1, kh0=kh0).reshape(shape)[()]
+
 # =============================================================================
 # PADE APPROXIMANT - a ratio of two power series
 # =============================================================================
 
+# Coefficients of the pade2025() approximants in ascending powers of k0h, one tuple per formula:
+#     kh ≈ √k0h · (n₀ + n₁·k0h + n₂·k0h² + …) / (1 + d₁·k0h + d₂·k0h² + …)
+PADE2025_NUM = (
+    (1.00649052194019, 0.423646282789217, 0.175406661440005),
+    (0.998980252114366, 0.0240176797055886, 0.102524886754552, 0.0317327085938995),
+    (1.00006668638419, 0.322645945302282, 0.0860384450810725, 0.051143347041175,
+     0.0153420957423937),
+    (0.999996682596798, -0.0889915717930786, 0.147076211695128, 0.0123471280480147,
+     0.00866458140843225, 0.00204463718201973),
+    (0.999998218345888, -0.424362176674708, 0.171875463304611, -0.0357487982640122,
+     0.00410625374333464, -0.000978753693904127, -0.000636955605769902),
+    (1.0000000012405, -0.350251200743747, 0.229153326540668, -0.0205204312544928,
+     0.0133231478358294, 0.0010401274983046, 0.00048671850792775, 8.40088474488992e-5),
+    (0.999999995257458, -0.543811114837314, 0.297774393256421, -0.0648661921727468,
+     0.0174768559302056, -0.00151793039097231, 0.000295750461715408, -4.1567697098083e-6,
+     -1.62498860684328e-5),
+    (1.00000000020126, -0.388439115555858, 0.310223332529737, -0.0496321949056331,
+     0.0293825301580729, -0.000149900084396432, 0.00139739652490532, 0.000171592322622253,
+     4.94349555930422e-5, 5.36329658499187e-6),
+    (1.00000000054683, -0.302517970258141, 0.216194173804703, -0.00911867675112112,
+     0.0131923444114312, 0.00197230469011907, 0.000583685774943952, 0.000117061426950459,
+     2.16577683514269e-5, -4.06436904033371e-6, -1.35655741732812e-7),
+    (1.00000000069543, -0.334954381847524, 0.229997336203832, -0.0170932674073579,
+     0.0142286437913579, 0.00157766182461221, 0.000555414435408452, 0.000109241385068583,
+     2.04181414663277e-5, -4.47936721320148e-6, 7.20245847805242e-8, 2.27591359161482e-9),
+    (1.00000000021134, -0.439538511010958, 0.262071966075091, -0.0352260757847662,
+     0.0136888861362354, 0.00119983590894612, 0.000306132196963262, 9.3344593984067e-5,
+     1.13485236045952e-5, -2.19033671564094e-6, -1.52303393432862e-7, 3.29680588537e-8,
+     -3.59648926971857e-9),
+    (1.00000000034658, -0.35765423836608, 0.220474157851537, -0.0143101981637556,
+     0.0106882664277003, 0.00177809831685665, 0.000425551341246499, 8.39454668343144e-5,
+     1.68918586510378e-5, -3.47736023040874e-6, 1.1564308170262e-7, -5.38824115168048e-9,
+     2.55400838802905e-9, -5.77246087402385e-10),
+    (1.00000000043044, -0.341214787680155, 0.216029315236116, -0.0116443516054976,
+     0.0108812744435703, 0.00184089184824533, 0.000466873470691525, 8.83178779786945e-5,
+     1.82969284264395e-5, -3.70984687913519e-6, 1.15252770559743e-7, 4.05866020101675e-10,
+     1.00682972256747e-9, -1.03386709606535e-10, 2.54165346162395e-11),
+)
+
+PADE2025_DEN = (
+    (1.0, 0.306955955676234, 0.0328975279727171),
+    (1.0, -0.150350405960952, 0.112157962910113, 0.00294483072586115),
+    (1.0, 0.157166943736625, 0.0245168267924732, 0.0462567432956417,
+     0.00175392506101448),
+    (1.0, -0.255723982020183, 0.159493904911975, -0.0106101311382749,
+     0.00784491418150148, 0.000184273251439305),
+    (1.0, -0.591069429462395, 0.240083348894323, -0.0617593442909405,
+     0.0104920694265126, -0.00231970889331938, -5.65924775627923e-5),
+    (1.0, -0.516917882097882, 0.284751410622371, -0.0555622365621819,
+     0.0161071584333013, -0.000808341017586247, 0.000381511960690599, 6.40735447518177e-6),
+    (1.0, -0.710477969437912, 0.385633880896532, -0.110812474410256,
+     0.0270500418196004, -0.00394602590941703, 0.000553921270262525, -6.65533846723705e-5,
+     -1.24656671282763e-6),
+    (1.0, -0.555105771884377, 0.372185262898829, -0.0980736559689507,
+     0.036689986163131, -0.00440840853967443, 0.00139722437126806, -3.64106868131082e-6,
+     2.72315576473091e-5, 3.80576928768955e-7),
+    (1.0, -0.469184609052338, 0.263835664763448, -0.0421256860069538,
+     0.0141905686336732, 0.000171234247175628, 0.000284037180073895, 7.23728845968762e-5,
+     -3.33925175755566e-6, -1.1196042731312e-6, -6.10361897619335e-9),
+    (1.0, -0.501621014271701, 0.283044819037831, -0.0523102821262626,
+     0.0164455383396673, -0.000365622576684072, 0.000304882740985283, 7.15596032735346e-5,
+     -5.64260090297976e-6, -7.22847827757772e-7, 3.16954475149092e-8, -4.18523172095159e-11),
+    (1.0, -0.606205166733527, 0.332550449569891, -0.0755002415059252,
+     0.0186169006337531, -0.000624409536143469, 0.000110698204767146, 7.31839474973857e-5,
+     -4.17221912299122e-6, -1.00985652913037e-6, 1.15600808535017e-7, -7.31093937337407e-9,
+     -3.576922099426e-10),
+    (1.0, -0.524320887192481, 0.277305164506462, -0.0478782214771677,
+     0.0124223110237922, 0.00037129622072912, 0.000158246646088704, 5.24876551697954e-5,
+     -1.38557325635002e-6, -7.96232034767084e-7, 8.35464703802028e-9, 1.1834526426828e-8,
+     -1.48873774124982e-9, -5.59846037648501e-11),
+    (1.0, -0.507881432557414, 0.27012036160695, -0.0445169260696995,
+     0.0122182321499095, 0.00039913233839911, 0.000190210573213751, 5.3696821111172e-5,
+     -1.69377956737975e-6, -7.45889615784955e-7, 1.5632250659559e-9, 1.19811786331838e-8,
+     -1.3440816876962e-9, 1.13151579925971e-10, 1.46210486272321e-12),
+)
+
+# The same coefficients as two contiguous float64 tables, one row per formula (row i holds
+# formula i + 1) zero-padded to the longest polynomial; _PADE2025_LENGTHS[i] is the number of
+# coefficients actually used by row i.
+_PADE2025_LENGTHS = np.array([len(num) for num in PADE2025_NUM])
+_PADE2025_NUM_COEFFS = np.zeros((len(PADE2025_NUM), _PADE2025_LENGTHS.max()))
+_PADE2025_DEN_COEFFS = np.zeros_like(_PADE2025_NUM_COEFFS)
+for _i, (_num, _den) in enumerate(zip(PADE2025_NUM, PADE2025_DEN)):
+    _PADE2025_NUM_COEFFS[_i, :len(_num)] = _num
+    _PADE2025_DEN_COEFFS[_i, :len(_den)] = _den
+del _i, _num, _den
+
+# One (numerator, denominator) pair of views into those tables per formula, so that the
+# compiled kernels below can be dispatched by indexing this tuple.
+_PADE2025_COEFFS = tuple((_PADE2025_NUM_COEFFS[i, :n], _PADE2025_DEN_COEFFS[i, :n])
+                         for i, n in enumerate(_PADE2025_LENGTHS))
+
+def _pade2025_eval(k0h, formula_idx):
+    # Formula formula_idx + 1 evaluated with numpy.polynomial.polynomial.polyval, which works on
+    # scalars and arrays alike; the rows are trimmed to their used length so that the padding
+    # costs nothing.
+    n = _PADE2025_LENGTHS[formula_idx]
+    num = np.polynomial.polynomial.polyval(k0h, _PADE2025_NUM_COEFFS[formula_idx, :n])
+    den = np.polynomial.polynomial.polyval(k0h, _PADE2025_DEN_COEFFS[formula_idx, :n])
+    return np.sqrt(k0h) * num / den
+
+@njit(cache=True, fastmath=True)
+def _pade2025_horner(num, den, k0h):
+    # Horner's scheme in k0h (integer powers only); the half powers of the numerator
+    # come from a single factor √k0h.  num and den are tuples of floats: given the global
+    # PADE2025_NUM/PADE2025_DEN entries, numba treats them as compile-time constants, unrolls
+    # the loops and folds the coefficients into the code.  Starting from num[-1] + 0·k0h makes
+    # the accumulators arrays when k0h is an array, so the same kernel serves both.
+    p = num[-1] + 0.0 * k0h
+    for c in num[-2::-1]:
+        p = p * k0h + c
+    q = den[-1] + 0.0 * k0h
+    for c in den[-2::-1]:
+        q = q * k0h + c
+    return np.sqrt(k0h) * p / q
+
+# Formulas from this number on have 12 to 15 coefficients per polynomial and are evaluated
+# with _pade2025_estrin(); their coefficient tuples are zero-padded to 16 entries.
+_PADE2025_ESTRIN_FROM = 10
+_PADE2025_ESTRIN_NUM = tuple(num + (0.0,) * (16 - len(num)) for num in PADE2025_NUM[_PADE2025_ESTRIN_FROM - 1:])
+_PADE2025_ESTRIN_DEN = tuple(den + (0.0,) * (16 - len(den)) for den in PADE2025_DEN[_PADE2025_ESTRIN_FROM - 1:])
+
+@njit(cache=True, fastmath=True)
+def _poly_estrin16(x, c):
+    # Estrin's scheme for c[0] + c[1]·x + … + c[15]·x¹⁵: pairs (c[i] + c[i+1]·x) are combined
+    # with x², x⁴ and x⁸, so the critical path is 4 multiply-adds deep instead of Horner's 15
+    # and the independent sub-polynomials can run side by side in the CPU pipeline.
+    x2 = x * x
+    x4 = x2 * x2
+    x8 = x4 * x4
+    a = (c[0] + x * c[1]) + x2 * (c[2] + x * c[3])
+    b = (c[4] + x * c[5]) + x2 * (c[6] + x * c[7])
+    e = (c[8] + x * c[9]) + x2 * (c[10] + x * c[11])
+    f = (c[12] + x * c[13]) + x2 * (c[14] + x * c[15])
+    return (a + x4 * b) + x8 * (e + x4 * f)
+
+@njit(cache=True, fastmath=True)
+def _pade2025_estrin(num, den, k0h):
+    return np.sqrt(k0h) * _poly_estrin16(k0h, num) / _poly_estrin16(k0h, den)
+
+def _pade2025_codegen(num, den):
+    # Generate and compile a plain Python function for one formula, with both polynomials
+    # written out in Horner form as float literals (no loops).  Used by _pade2025_kernel() when
+    # numba is not installed; k0h ** 0.5 keeps it valid for arrays.
+    def horner_src(coeffs):
+        src = repr(coeffs[-1])
+        for c in coeffs[-2::-1]:
+            src = f"({src} * k0h + {c!r})"
+        return src
+    src = f"def f(k0h):\n    return k0h ** 0.5 * {horner_src(num)} / {horner_src(den)}\n"
+    namespace = {}
+    exec(compile(src, "<pade2025>", "exec"), namespace)
+    return namespace["f"]
+
+def _pade2025_kernel(formula):
+    # One compiled function per pade2025() formula, for scalar or array k0h.  Its coefficient
+    # tuples are closure variables, which numba freezes into compile-time constants, so each
+    # formula gets its own code with the coefficients baked in (and its own entry in the disk
+    # cache, which is keyed on the closure's contents).
+    num, den = PADE2025_NUM[formula - 1], PADE2025_DEN[formula - 1]
+    if not HAVE_NUMBA:
+        return _pade2025_codegen(num, den)
+    if formula >= _PADE2025_ESTRIN_FROM:
+        i = formula - _PADE2025_ESTRIN_FROM
+        num, den = _PADE2025_ESTRIN_NUM[i], _PADE2025_ESTRIN_DEN[i]
+        @njit(cache=True, fastmath=True)
+        def pade2025_formula(k0h):
+            return _pade2025_estrin(num, den, k0h)
+    else:
+        @njit(cache=True, fastmath=True)
+        def pade2025_formula(k0h):
+            return _pade2025_horner(num, den, k0h)
+    return pade2025_formula
+
+# pade2025() dispatch table keyed by formula number.  Like the == tests of an if/elif chain,
+# a dict lookup also matches integral floats (2.0) and NumPy integers.
+_PADE2025_DISPATCH = {formula: _pade2025_kernel(formula) for formula in range(1, len(PADE2025_NUM) + 1)}
+
 def pade2025(k0h, formula):
     """
     Approximations using Padé approximants for the nondimensional wavenumber.
@@ -182,50 +484,317 @@ def pade2025(k0h, formula):
       Performance assessments must be conducted for choosing ideal formulation to the given input.
 
     **Parameters:**
-      k0h (float): Nondimensional deep-water parameter (k₀·h). Should be >=0 and <= 2π.
+      k0h (float or array_like): Nondimensional deep-water parameter (k₀·h). Should be >=0 and <= 2π.
       formula (int): An integer (1 to 13) indicating which formula to compute and use.
 
     **Returns:**
-      float: An approximation to nondimensional wavenumber, kh.
+      float or numpy.ndarray: An approximation to nondimensional wavenumber, kh.
       returns -1.0 when 'formula' parameters are inappropriate / non compliant of input regulations.
 
     **References:**
         - R. Carvalho (2025). Work published on GitHub, actually the code you're reading right now.
     """
 
-    if formula == 1:
-        return ( (1.00649052194019*k0h**0.5 + 0.423646282789217*k0h**1.5 + 0.175406661440005*k0h**2.5) ) / ( (0.306955955676234*k0h**1.0 + 0.0328975279727171*k0h**2.0 + 1) )
-    elif formula == 2:
-        return ( (0.998980252114366*k0h**0.5 + 0.0240176797055886*k0h**1.5 + 0.102524886754552*k0h**2.5 + 0.0317327085938995*k0h**3.5) ) / ( (-0.150350405960952*k0h**1.0 + 0.112157962910113*k0h**2.0 + 0.00294483072586115*k0h**3.0 + 1) )
-    elif formula == 3:
-        return ( (1.00006668638419*k0h**0.5 + 0.322645945302282*k0h**1.5 + 0.0860384450810725*k0h**2.5 + 0.051143347041175*k0h**3.5 + 0.0153420957423937*k0h**4.5) ) / ( (0.157166943736625*k0h**1.0 + 0.0245168267924732*k0h**2.0 + 0.0462567432956417*k0h**3.0 + 0.00175392506101448*k0h**4.0 + 1) )
-    elif formula == 4:
-        return ( (0.999996682596798*k0h**0.5 - 0.0889915717930786*k0h**1.5 + 0.147076211695128*k0h**2.5 + 0.0123471280480147*k0h**3.5 + 0.00866458140843225*k0h**4.5 + 0.00204463718201973*k0h**5.5) ) / ( (-0.255723982020183*k0h**1.0 + 0.159493904911975*k0h**2.0 - 0.0106101311382749*k0h**3.0 + 0.00784491418150148*k0h**4.0 + 0.000184273251439305*k0h**5.0 + 1) )
-    elif formula == 5:
-        return ( (0.999998218345888*k0h**0.5 - 0.424362176674708*k0h**1.5 + 0.171875463304611*k0h**2.5 - 0.0357487982640122*k0h**3.5 + 0.00410625374333464*k0h**4.5 - 0.000978753693904127*k0h**5.5 - 0.000636955605769902*k0h**6.5) ) / ( (-0.591069429462395*k0h**1.0 + 0.240083348894323*k0h**2.0 - 0.0617593442909405*k0h**3.0 + 0.0104920694265126*k0h**4.0 - 0.00231970889331938*k0h**5.0 - 5.65924775627923e-5*k0h**6.0 + 1) )
-    elif formula == 6:
-        return ( (1.0000000012405*k0h**0.5 - 0.350251200743747*k0h**1.5 + 0.229153326540668*k0h**2.5 - 0.0205204312544928*k0h**3.5 + 0.0133231478358294*k0h**4.5 + 0.0010401274983046*k0h**5.5 + 0.00048671850792775*k0h**6.5 + 8.40088474488992e-5*k0h**7.5) ) / ( (-0.516917882097882*k0h**1.0 + 0.284751410622371*k0h**2.0 - 0.0555622365621819*k0h**3.0 + 0.0161071584333013*k0h**4.0 - 0.000808341017586247*k0h**5.0 + 0.000381511960690599*k0h**6.0 + 6.40735447518177e-6*k0h**7.0 + 1) )
-    elif formula == 7:
-        return ( (0.999999995257458*k0h**0.5 - 0.543811114837314*k0h**1.5 + 0.297774393256421*k0h**2.5 - 0.0648661921727468*k0h**3.5 + 0.0174768559302056*k0h**4.5 - 0.00151793039097231*k0h**5.5 + 0.000295750461715408*k0h**6.5 - 4.1567697098083e-6*k0h**7.5 - 1.62498860684328e-5*k0h**8.5) ) / ( (-0.710477969437912*k0h**1.0 + 0.385633880896532*k0h**2.0 - 0.110812474410256*k0h**3.0 + 0.0270500418196004*k0h**4.0 - 0.00394602590941703*k0h**5.0 + 0.000553921270262525*k0h**6.0 - 6.65533846723705e-5*k0h**7.0 - 1.24656671282763e-6*k0h**8.0 + 1) )
-    elif formula == 8:
-        return ( (1.00000000020126*k0h**0.5 - 0.388439115555858*k0h**1.5 + 0.310223332529737*k0h**2.5 - 0.0496321949056331*k0h**3.5 + 0.0293825301580729*k0h**4.5 - 0.000149900084396432*k0h**5.5 + 0.00139739652490532*k0h**6.5 + 0.000171592322622253*k0h**7.5 + 4.94349555930422e-5*k0h**8.5 + 5.36329658499187e-6*k0h**9.5) ) / ( (-0.555105771884377*k0h**1.0 + 0.372185262898829*k0h**2.0 - 0.0980736559689507*k0h**3.0 + 0.036689986163131*k0h**4.0 - 0.00440840853967443*k0h**5.0 + 0.00139722437126806*k0h**6.0 - 3.64106868131082e-6*k0h**7.0 + 2.72315576473091e-5*k0h**8.0 + 3.80576928768955e-7*k0h**9.0 + 1) )
-    elif formula == 9:
-        return ( (1.00000000054683*k0h**0.5 - 0.302517970258141*k0h**1.5 + 0.216194173804703*k0h**2.5 - 0.00911867675112112*k0h**3.5 + 0.0131923444114312*k0h**4.5 + 0.00197230469011907*k0h**5.5 + 0.000583685774943952*k0h**6.5 + 0.000117061426950459*k0h**7.5 + 2.16577683514269e-5*k0h**8.5 - 4.06436904033371e-6*k0h**9.5 - 1.35655741732812e-7*k0h**10.5) ) / ( (-0.469184609052338*k0h**1.0 + 0.263835664763448*k0h**2.0 - 0.0421256860069538*k0h**3.0 + 0.0141905686336732*k0h**4.0 + 0.000171234247175628*k0h**5.0 + 0.000284037180073895*k0h**6.0 + 7.23728845968762e-5*k0h**7.0 - 3.33925175755566e-6*k0h**8.0 - 1.1196042731312e-6*k0h**9.0 - 6.10361897619335e-9*k0h**10.0 + 1) )
-    elif formula == 10:
-        return ( (1.00000000069543*k0h**0.5 - 0.334954381847524*k0h**1.5 + 0.229997336203832*k0h**2.5 - 0.0170932674073579*k0h**3.5 + 0.0142286437913579*k0h**4.5 + 0.00157766182461221*k0h**5.5 + 0.000555414435408452*k0h**6.5 + 0.000109241385068583*k0h**7.5 + 2.04181414663277e-5*k0h**8.5 - 4.47936721320148e-6*k0h**9.5 + 7.20245847805242e-8*k0h**10.5 + 2.27591359161482e-9*k0h**11.5) ) / ( (-0.501621014271701*k0h**1.0 + 0.283044819037831*k0h**2.0 - 0.0523102821262626*k0h**3.0 + 0.0164455383396673*k0h**4.0 - 0.000365622576684072*k0h**5.0 + 0.000304882740985283*k0h**6.0 + 7.15596032735346e-5*k0h**7.0 - 5.64260090297976e-6*k0h**8.0 - 7.22847827757772e-7*k0h**9.0 + 3.16954475149092e-8*k0h**10.0 - 4.18523172095159e-11*k0h**11.0 + 1) )
-    elif formula == 11:
-        return ( (1.00000000021134*k0h**0.5 - 0.439538511010958*k0h**1.5 + 0.262071966075091*k0h**2.5 - 0.0352260757847662*k0h**3.5 + 0.0136888861362354*k0h**4.5 + 0.00119983590894612*k0h**5.5 + 0.000306132196963262*k0h**6.5 + 9.3344593984067e-5*k0h**7.5 + 1.13485236045952e-5*k0h**8.5 - 2.19033671564094e-6*k0h**9.5 - 1.52303393432862e-7*k0h**10.5 + 3.29680588537e-8*k0h**11.5 - 3.59648926971857e-9*k0h**12.5) ) / ( (-0.606205166733527*k0h**1.0 + 0.332550449569891*k0h**2.0 - 0.0755002415059252*k0h**3.0 + 0.0186169006337531*k0h**4.0 - 0.000624409536143469*k0h**5.0 + 0.000110698204767146*k0h**6.0 + 7.31839474973857e-5*k0h**7.0 - 4.17221912299122e-6*k0h**8.0 - 1.00985652913037e-6*k0h**9.0 + 1.15600808535017e-7*k0h**10.0 - 7.31093937337407e-9*k0h**11.0 - 3.576922099426e-10*k0h**12.0 + 1) )
-    elif formula == 12:
-        return ( (1.00000000034658*k0h**0.5 - 0.35765423836608*k0h**1.5 + 0.220474157851537*k0h**2.5 - 0.0143101981637556*k0h**3.5 + 0.0106882664277003*k0h**4.5 + 0.00177809831685665*k0h**5.5 + 0.000425551341246499*k0h**6.5 + 8.39454668343144e-5*k0h**7.5 + 1.68918586510378e-5*k0h**8.5 - 3.47736023040874e-6*k0h**9.5 + 1.1564308170262e-7*k0h**10.5 - 5.38824115168048e-9*k0h**11.5 + 2.55400838802905e-9*k0h**12.5 - 5.77246087402385e-10*k0h**13.5) ) / ( (-0.524320887192481*k0h**1.0 + 0.277305164506462*k0h**2.0 - 0.0478782214771677*k0h**3.0 + 0.0124223110237922*k0h**4.0 + 0.00037129622072912*k0h**5.0 + 0.000158246646088704*k0h**6.0 + 5.24876551697954e-5*k0h**7.0 - 1.38557325635002e-6*k0h**8.0 - 7.96232034767084e-7*k0h**9.0 + 8.35464703802028e-9*k0h**10.0 + 1.1834526426828e-8*k0h**11.0 - 1.48873774124982e-9*k0h**12.0 - 5.59846037648501e-11*k0h**13.0 + 1) )
-    elif formula == 13:
-        return ( (1.00000000043044*k0h**0.5 - 0.341214787680155*k0h**1.5 + 0.216029315236116*k0h**2.5 - 0.0116443516054976*k0h**3.5 + 0.0108812744435703*k0h**4.5 + 0.00184089184824533*k0h**5.5 + 0.000466873470691525*k0h**6.5 + 8.83178779786945e-5*k0h**7.5 + 1.82969284264395e-5*k0h**8.5 - 3.70984687913519e-6*k0h**9.5 + 1.15252770559743e-7*k0h**10.5 + 4.05866020101675e-10*k0h**11.5 + 1.00682972256747e-9*k0h**12.5 - 1.03386709606535e-10*k0h**13.5 + 2.54165346162395e-11*k0h**14.5) ) / ( (-0.507881432557414*k0h**1.0 + 0.27012036160695*k0h**2.0 - 0.0445169260696995*k0h**3.0 + 0.0122182321499095*k0h**4.0 + 0.00039913233839911*k0h**5.0 + 0.000190210573213751*k0h**6.0 + 5.3696821111172e-5*k0h**7.0 - 1.69377956737975e-6*k0h**8.0 - 7.45889615784955e-7*k0h**9.0 + 1.5632250659559e-9*k0h**10.0 + 1.19811786331838e-8*k0h**11.0 - 1.3440816876962e-9*k0h**12.0 + 1.13151579925971e-10*k0h**13.0 + 1.46210486272321e-12*k0h**14.0 + 1) )
-    else:
+    func = _PADE2025_DISPATCH.get(formula)
+    if func is None:
         return -1
+    return func(k0h)
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _pade2025_batch_kernel(k0h, num, den, out):
+    # out[i] = pade2025 at k0h[i] for flat arrays of either float64 or float32, computed in the
+    # arrays' precision.  The points are split into blocks spread over threads (the compiled loop
+    # runs without the GIL); within a block each Horner step sweeps all points, an inner loop
+    # the compiler turns into SIMD instructions.
+    block = 256
+    for b in prange((k0h.size + block - 1) // block):
+        x = k0h[b * block:(b + 1) * block]
+        p = np.full(x.size, num[-1], dtype=k0h.dtype)
+        q = np.full(x.size, den[-1], dtype=k0h.dtype)
+        for i in range(num.size - 2, -1, -1):
+            c_num, c_den = num[i], den[i]
+            for j in range(x.size):
+                p[j] = p[j] * x[j] + c_num
+                q[j] = q[j] * x[j] + c_den
+        for j in range(x.size):
+            out[b * block + j] = np.sqrt(x[j]) * p[j] / q[j]
+
+def pade2025_batch(k0h, formula, out=None):
+    """
+    Vectorized counterpart of pade2025() for NumPy arrays of *k0h*; the preferred API when
+    evaluating many depths at once.
+
+    **Method:**
+      With numba, a compiled loop evaluates both polynomials of the selected formula by
+      Horner's scheme on blocks of points, using SIMD instructions and all CPU cores.  Without numba,
+      they are evaluated over the whole array with numpy.polynomial.polynomial.polyval.  In
+      both cases the numerator's half powers come from a single square root of k0h.
+
+    **Parameters:**
+      k0h (array_like): Nondimensional deep-water parameters (k₀·h). Should be >=0 and <= 2π.
+      formula (int): An integer (1 to 13) indicating which formula to compute and use.
+      out (numpy.ndarray, optional): C-contiguous float64 array with the shape of *k0h* that
+          receives the result, to avoid allocating one on repeated calls.
+
+    **Returns:**
+      numpy.ndarray: Approximations to the nondimensional wavenumber, kh (*out* when given).
+      returns -1.0 when 'formula' is out of range.
+    """
+    if not 1 <= formula <= len(_PADE2025_COEFFS):
+        return -1.0
+    k0h = np.asarray(k0h, dtype=float)
+    if out is None:
+        out = np.empty(k0h.shape)
+    if HAVE_NUMBA:
+        num, den = _PADE2025_COEFFS[formula - 1]
+        _pade2025_batch_kernel(np.ascontiguousarray(k0h).reshape(-1), num, den, out.reshape(-1))
+    else:
+        out[...] = _pade2025_eval(k0h, formula - 1)
+    return out
+
+# Single-precision copies of the coefficient tables for pade2025_f32().
+_PADE2025_NUM_COEFFS_F32 = _PADE2025_NUM_COEFFS.astype(np.float32)
+_PADE2025_DEN_COEFFS_F32 = _PADE2025_DEN_COEFFS.astype(np.float32)
+
+def pade2025_f32(k0h, formula):
+    """
+    Single-precision counterpart of pade2025_batch() for large arrays of *k0h*, when memory
+    bandwidth rather than arithmetic limits the evaluation.
+
+    **Method:**
+      Inputs, coefficients, Horner recurrences and results are all float32, which halves the
+      bytes read and written and doubles the number of SIMD lanes.
+
+    **Accuracy:**
+      For every formula except 5 and 7, rounding in float32 adds a relative error of 3e-7 to
+      5e-7 on top of the formula's own error.  The denominators of formulas 5 and 7 come close
+      to zero near k0h ≈ 2.95 and k0h ≈ 5.33, which amplifies the rounding there: the added error
+      reaches about 1e-3 on a 10,000-point grid over [0, 2π] and several percent on finer grids.
+      Do not use this path for formulas 5 and 7; use pade2025_batch() instead.
+
+    **Parameters:**
+      k0h (array_like): Nondimensional deep-water parameters (k₀·h). Should be >=0 and <= 2π.
+      formula (int): An integer (1 to 13) indicating which formula to compute and use.
+
+    **Returns:**
+      numpy.ndarray: float32 approximations to the nondimensional wavenumber, kh.
+      returns -1.0 when 'formula' is out of range.
+    """
+    if not 1 <= formula <= len(_PADE2025_COEFFS):
+        return -1.0
+    k0h = np.asarray(k0h, dtype=np.float32)
+    n = _PADE2025_LENGTHS[formula - 1]
+    num = _PADE2025_NUM_COEFFS_F32[formula - 1, :n]
+    den = _PADE2025_DEN_COEFFS_F32[formula - 1, :n]
+    if HAVE_NUMBA:
+        out = np.empty(k0h.shape, dtype=np.float32)
+        _pade2025_batch_kernel(np.ascontiguousarray(k0h).reshape(-1), num, den, out.reshape(-1))
+        return out
+    return np.sqrt(k0h) * np.polynomial.polynomial.polyval(k0h, num) / np.polynomial.polynomial.polyval(k0h, den)
+
+def pade2025_all(k0h):
+    """
+    All pade2025() formulas at once, for comparing the approximants at the same depths.
+
+    **Method:**
+      The powers 1, k0h, k0h², … of each depth are built once by successive multiplication
+      and shared by every formula: both polynomials of all formulas then reduce to two
+      matrix-vector products with the zero-padded coefficient tables, and √k0h is taken
+      once per depth.
+
+    **Parameters:**
+      k0h (float or array_like): Nondimensional deep-water parameter(s) (k₀·h). Should be >=0 and <= 2π.
+
+    **Returns:**
+      numpy.ndarray: Approximations to the nondimensional wavenumber, kh, with a trailing axis
+      of length 13; element [..., n - 1] is pade2025(k0h, n).
+    """
+    k0h = np.asarray(k0h, dtype=float)
+    powers = np.empty(k0h.shape + (_PADE2025_NUM_COEFFS.shape[1],))
+    powers[..., 0] = 1.0
+    powers[..., 1:] = k0h[..., np.newaxis]
+    np.cumprod(powers, axis=-1, out=powers)
+    num = powers @ _PADE2025_NUM_COEFFS.T
+    den = powers @ _PADE2025_DEN_COEFFS.T
+    return np.sqrt(k0h)[..., np.newaxis] * num / den
 
 # =============================================================================
 # CARVALHO (2025) GEP-based approximations
 # =============================================================================
 
+@njit(cache=True, fastmath=True)
+def _sinh_tanh(x):
+    # sinh(x) and tanh(x) from a single expm1 call.  With m = eˣ - 1, m·(m + 2) = e²ˣ - 1, so
+    #   sinh(x) = m·(m + 2) / (2·(m + 1))   and   tanh(x) = 1 / (1 + 2 / (m·(m + 2)))
+    # without the cancellation of (eˣ - e⁻ˣ) / 2 for small x.  Beyond x = 20, tanh(x) rounds to
+    # 1 and e⁻ˣ is negligible next to eˣ; returning there also keeps m·(m + 2) from overflowing
+    # to inf (from x ≈ 355 on) and sinh from becoming inf / inf.
+    if x > 20.0:
+        return 0.5 * math.exp(x), 1.0
+    m = math.expm1(x)
+    mm = m * (m + 2)
+    return 0.5 * m * ((m + 2) / (m + 1)), 1 / (1 + 2 / mm)
+
+# Natural logs of the constant bases raised to a variable power in the formulas below, so that
+# c ** x is evaluated as exp(log(c) · x) rather than through a general pow().
+_LOG_1_1999 = math.log(1.1999)
+_LOG_1_199315 = math.log(1.199315)
+_LOG_1_2 = math.log(6 / 5)
+_LOG_1_438995 = math.log(1.438995)
+_LOG_4_35144 = math.log(4.35144)
+_LOG_4_89859 = math.log(4.89859)
+_LOG_10 = math.log(10)
+
+# Formula 8 clamps k0h at 3.04425 inside sinh(√k0h); the clamped value is a constant.
+_SINH_SQRT_3_04425 = math.sinh(math.sqrt(3.04425))
+
+# One function per carvalho2025() formula, dispatched by index instead of an if/elif chain.
+# Every formula returns 0.0 at k0h == 0, the limit of kh at zero depth; most of them would
+# otherwise evaluate 0 / 0 there.
+# Several formulas are one more step x -> k0h / tanh(x) of the fixed-point iteration applied to
+# another formula (3 to 9, 4 to 7, 12 to 18); they call that formula instead of repeating it.
+@njit(cache=True, fastmath=True)
+def _carvalho2025_1(k0h):
+    if k0h == 0:
+        return 0.0
+    kh_Carv = _carvalho2025_3(k0h)
+    # (kh² + k0h·cosh²(kh)) / (kh + sinh(kh)·cosh(kh)), divided through by cosh²(kh) = 1 / (1 - t²)
+    t = math.tanh(kh_Carv)
+    sech2 = 1 - t * t
+    return (kh_Carv * kh_Carv * sech2 + k0h) / (kh_Carv * sech2 + t)
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_2(k0h):
+    if k0h == 0:
+        return 0.0
+    if k0h <= 1.2:
+        inv_k = 1 / k0h
+        return math.sqrt(inv_k - math.exp(k0h ** 1.962983 - 6.242035)) / (inv_k - 0.168659434)
+    elif 1.2 < k0h <= 2.35:
+        return (k0h + (k0h / 70.13327717) ** (k0h * k0h * k0h)) / math.exp(_LOG_4_89859 * k0h / (1.134674 - math.exp(_LOG_10 * k0h)))
+    else:
+        return k0h * math.exp(1.596671172 * k0h * math.exp(-_LOG_10 * k0h))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_3(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(_carvalho2025_9(k0h))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_4(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(_carvalho2025_7(k0h))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_5(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / (math.tanh(math.exp(_LOG_1_199315 * k0h ** 1.047086) * k0h ** 0.499947))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_6(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(math.exp(_LOG_1_1999 * k0h ** 1.045) * math.sqrt(k0h))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_7(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(k0h / math.tanh(k0h / math.sinh(math.tanh(math.sqrt(k0h)))))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_8(k0h):
+    if k0h == 0:
+        return 0.0
+    sinh_sqrt = _SINH_SQRT_3_04425 if k0h >= 3.04425 else math.sinh(math.sqrt(k0h))
+    return k0h / math.tanh(sinh_sqrt * math.cosh(k0h * (1 / 5.194671)))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_9(k0h):
+    if k0h == 0:
+        return 0.0
+    sinh_k, tanh_k = _sinh_tanh(k0h)
+    return k0h / (math.sqrt(math.tanh(math.sqrt(sinh_k)) * math.sqrt(tanh_k)))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_10(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(math.exp(_LOG_1_2 * k0h) * math.sqrt(k0h))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_11(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(math.sqrt(math.exp(_LOG_1_438995 * k0h) * k0h))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_12(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(_carvalho2025_18(k0h))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_13(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h + math.sqrt(k0h) / (math.exp(_LOG_4_35144 * k0h) + 0.718409 / (1 / k0h) ** 0.437408)
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_14(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / (math.tanh(math.sqrt(k0h)) ** (1 / math.cosh(k0h)))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_15(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / (math.sqrt(math.tanh(k0h)) * math.tanh(k0h + 1 / math.sqrt(k0h)))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_16(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(k0h) ** ((k0h + 4) * 0.125)
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_17(k0h):
+    if k0h == 0:
+        return 0.0
+    tanh_k = math.tanh(k0h)
+    # (tanh^(k0h/tanh))^0.5 as a single power
+    return k0h / tanh_k ** (0.5 * k0h / tanh_k)
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_18(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(math.sinh(math.sqrt(k0h)))
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_19(k0h):
+    return math.sqrt(k0h) + k0h * k0h / (k0h + 4)
+
+@njit(cache=True, fastmath=True)
+def _carvalho2025_20(k0h):
+    if k0h == 0:
+        return 0.0
+    tanh_k = math.tanh(k0h)
+    # ((√tanh)^(tanh + 4))^0.25 as a single power
+    return k0h / tanh_k ** ((tanh_k + 4) * 0.125)
+
+_CARVALHO2025 = (
+    _carvalho2025_1, _carvalho2025_2, _carvalho2025_3, _carvalho2025_4,
+    _carvalho2025_5, _carvalho2025_6, _carvalho2025_7, _carvalho2025_8,
+    _carvalho2025_9, _carvalho2025_10, _carvalho2025_11, _carvalho2025_12,
+    _carvalho2025_13, _carvalho2025_14, _carvalho2025_15, _carvalho2025_16,
+    _carvalho2025_17, _carvalho2025_18, _carvalho2025_19, _carvalho2025_20,
+)
+
 def carvalho2025(k0h, formula):
     """
     Approximations using Carvalho's (2025) Gene Expression Programming (GEP) solutions
@@ -266,63 +835,135 @@ def carvalho2025(k0h, formula):
         *Complex Systems*, 13(2), 87-129.
 
     Returns:
-      float: Approximated nondimensional wavenumber, kh.
+      float: Approximated nondimensional wavenumber, kh (0.0 at k0h = 0).
     """
-    if formula == 1:
-        kh_Carv = k0h / math.tanh(k0h / (math.sqrt(math.tanh(math.sqrt(math.sinh(k0h)))) * math.tanh(k0h) ** 0.25))
-        return (kh_Carv ** 2 + k0h * math.cosh(kh_Carv) ** 2) / (kh_Carv + math.sinh(kh_Carv) * math.cosh(kh_Carv))
-    elif formula == 2:
-        if k0h <= 1.2:
-            return math.sqrt(1 / k0h - math.exp(k0h ** 1.962983 - 6.242035)) / (1 / k0h - 0.168659434)
-        elif 1.2 < k0h <= 2.35:
-            return (k0h + (k0h / 70.13327717) ** (k0h ** 3)) / math.exp(math.log(4.89859 ** k0h) / (1.134674 - 10 ** k0h))
-        elif k0h > 2.35:
-            return k0h * math.exp(1.596671172 * k0h / (10 ** k0h))
-    elif formula == 3:
-        return k0h / math.tanh(
-            k0h / (math.sqrt(math.tanh(math.sqrt(math.sinh(k0h)))) * math.tanh(k0h) ** 0.25))
-    elif formula == 4:
-        return k0h / (math.tanh(k0h / math.tanh(k0h / math.tanh(k0h / math.sinh(math.tanh(math.sqrt(k0h)))))))
-    elif formula == 5:
-        return k0h / (math.tanh(1.199315 ** (k0h ** 1.047086) * k0h ** 0.499947))
-    elif formula == 6:
-        return k0h / math.tanh(math.pow(1.1999, k0h ** 1.045) * math.sqrt(k0h))
-    elif formula == 7:
-        return k0h / math.tanh(k0h / math.tanh(k0h / math.sinh(math.tanh(math.sqrt(k0h)))))
-    elif formula == 8:
-        return k0h / math.tanh(
-            math.sinh(math.sqrt(3.04425 if k0h >= 3.04425 else k0h)) * math.cosh(k0h / 5.194671))
-    elif formula == 9:
-        return k0h / (math.sqrt(math.tanh(math.sqrt(math.sinh(k0h)))) * math.tanh(k0h) ** 0.25)
-    elif formula == 10:
-        return k0h / math.tanh(((6 / 5) ** k0h) * math.sqrt(k0h))
-    elif formula == 11:
-        return k0h / math.tanh(math.sqrt((1.438995 ** k0h) * k0h))
-    elif formula == 12:
-        return k0h / math.tanh(k0h / math.tanh(math.sinh(math.sqrt(k0h))))
-    elif formula == 13:
-        return k0h + math.sqrt(k0h) / (4.35144 ** k0h + 0.718409 / (1 / k0h) ** 0.437408)
-    elif formula == 14:
-        return k0h / (math.tanh(math.sqrt(k0h)) ** (1 / math.cosh(k0h)))
-    elif formula == 15:
-        return k0h / (math.sqrt(math.tanh(k0h)) * math.tanh(k0h + 1 / math.sqrt(k0h)))
-    elif formula == 16:
-        return k0h / (math.tanh(k0h) ** ((k0h + 4) / 8))
-    elif formula == 17:
-        return k0h / ((math.tanh(k0h) ** (k0h / math.tanh(k0h))) ** 0.5)
-    elif formula == 18:
-        return k0h / math.tanh(math.sinh(math.sqrt(k0h)))
-    elif formula == 19:
-        return math.sqrt(k0h) + k0h ** 2 / (k0h + 4)
-    elif formula == 20:
-        return k0h / ((math.sqrt(math.tanh(k0h)) ** (math.tanh(k0h) + 4)) ** 0.25)
-    else:
+    if not 1 <= formula <= len(_CARVALHO2025):
         return -1
+    return _CARVALHO2025[formula - 1](k0h)
+
+def _carvalho2025_2_vec(k0h):
+    # Formula 2 without the per-element branch: the three pieces are evaluated on the whole
+    # array and blended with np.select.  Lanes outside a piece's range may overflow or divide
+    # by zero; those values are discarded, so the warnings are silenced.
+    with np.errstate(all='ignore'):
+        inv_k = 1 / k0h
+        shallow = np.sqrt(inv_k - np.exp(k0h ** 1.962983 - 6.242035)) / (inv_k - 0.168659434)
+        middle = (k0h + (k0h / 70.13327717) ** (k0h * k0h * k0h)) / np.exp(_LOG_4_89859 * k0h / (1.134674 - np.exp(_LOG_10 * k0h)))
+        deep = k0h * np.exp(1.596671172 * k0h * np.exp(-_LOG_10 * k0h))
+    return np.select([k0h <= 1.2, k0h <= 2.35], [shallow, middle], default=deep)
+
+# NumPy ufuncs built from the _carvalho2025_N kernels by carvalho2025_batch(), keyed by formula.
+# Without numba, formula 2 uses the branchless NumPy version instead of np.vectorize.
+_CARVALHO2025_UFUNCS = {} if HAVE_NUMBA else {2: _carvalho2025_2_vec}
+
+def carvalho2025_batch(k0h, formula):
+    """
+    Vectorized counterpart of carvalho2025() for NumPy arrays of *k0h*.
+
+    **Method:**
+      On first use of a formula its scalar kernel is turned into a NumPy ufunc: with numba,
+      `@vectorize(['float64(float64)'], target='parallel')` compiles a multithreaded SIMD loop;
+      without numba, np.vectorize is used as a plain-Python fallback, except for the piecewise
+      formula 2, which is evaluated branch-free with np.select.
+
+    **Parameters:**
+      k0h (array_like): Nondimensional deep-water parameters (k₀·h). Must be positive.
+      formula (int): An integer ranging from 1 to 20, inclusive, selecting which GEP formula to use.
+
+    **Returns:**
+      numpy.ndarray: Approximated nondimensional wavenumbers, kh; -1.0 when 'formula' is out of range.
+    """
+    if not 1 <= formula <= len(_CARVALHO2025):
+        return -1.0
+    ufunc = _CARVALHO2025_UFUNCS.get(formula)
+    if ufunc is None:
+        kernel = _CARVALHO2025[formula - 1]
+        if HAVE_NUMBA:
+            ufunc = vectorize(['float64(float64)'], target='parallel', fastmath=True)(kernel)
+        else:
+            ufunc = np.vectorize(kernel, otypes=[float])
+        _CARVALHO2025_UFUNCS[formula] = ufunc
+    return ufunc(np.asarray(k0h, dtype=float))
 
 # =============================================================================
 # YAMAGUCHI & NONANKA (2007) family of explicit solutions
 # =============================================================================
 
+@njit(cache=True, fastmath=True)
+def _coth(x):
+    # coth(x) from a single tanh instead of cosh / sinh; x = k0h**p > 0 for every caller
+    # (the formulas return early at k0h == 0), so there is no x == 0 branch
+    return 1.0 / math.tanh(x)
+
+# One compiled function per YamaguchiNonaka() formula (YN1–YN10), dispatched by index.  Like the
+# carvalho2025() formulas, each returns 0.0 at k0h == 0.
+@njit(cache=True, fastmath=True)
+def _yamaguchi_nonaka_1(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h * _coth(k0h**(1.485/2)) ** (1/1.485)
+
+@njit(cache=True, fastmath=True)
+def _yamaguchi_nonaka_2(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh( k0h * (_coth(k0h**(1.378/2)))**(1/1.378) )
+
+@njit(cache=True, fastmath=True)
+def _yamaguchi_nonaka_3(k0h):
+    if k0h == 0:
+        return 0.0
+    sqrt_k = math.sqrt(k0h)
+    return k0h / math.tanh(sqrt_k * (1.0 + sqrt_k/(2.0 * math.pi)))
+
+@njit(cache=True, fastmath=True)
+def _yamaguchi_nonaka_4(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h * math.sqrt(math.sqrt(1.0 + 1.0/(k0h*k0h)))
+
+@njit(cache=True, fastmath=True)
+def _yamaguchi_nonaka_5(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h * ((_coth(k0h**(1.434/2))) ** (1/1.434))
+
+@njit(cache=True, fastmath=True)
+def _yamaguchi_nonaka_6(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(math.sqrt(math.sinh(k0h)))
+
+@njit(cache=True, fastmath=True)
+def _yamaguchi_nonaka_7(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / ((-math.expm1(-k0h**(2.445/2))) ** (1/2.445))  # 1 - exp(-x) = -expm1(-x)
+
+@njit(cache=True, fastmath=True)
+def _yamaguchi_nonaka_8(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh(k0h * (_coth(k0h**(1.310/2)))**(1/1.310))
+
+@njit(cache=True, fastmath=True)
+def _yamaguchi_nonaka_9(k0h):
+    if k0h == 0:
+        return 0.0
+    return k0h / math.tanh((1.1965**k0h)*math.sqrt(k0h))
+
+@njit(cache=True, fastmath=True)
+def _yamaguchi_nonaka_10(k0h):
+    # YN10 is the same expression as carvalho2025() formula 3, which computes sinh(k0h) and
+    # tanh(k0h) from one expm1 and takes the fourth root as a square root of a product
+    return _carvalho2025_3(k0h)
+
+_YAMAGUCHI_NONAKA = (
+    _yamaguchi_nonaka_1, _yamaguchi_nonaka_2, _yamaguchi_nonaka_3, _yamaguchi_nonaka_4,
+    _yamaguchi_nonaka_5, _yamaguchi_nonaka_6, _yamaguchi_nonaka_7, _yamaguchi_nonaka_8,
+    _yamaguchi_nonaka_9, _yamaguchi_nonaka_10,
+)
+
 def YamaguchiNonaka(k0h, formula):
     """
     Yamaguchi & Nonaka (2007) family of explicit solutions (YN1–YN10).
@@ -349,35 +990,14 @@ def YamaguchiNonaka(k0h, formula):
         *Annu. Jour. Eng.*, Ehime Univ., Vol. 6, 2007 in CD-ROM.
 
     Returns:
-      float: Approximated nondimensional wavenumber, kh.
+      float: Approximated nondimensional wavenumber, kh (0.0 at k0h = 0).
     """
 
-    if k0h == 0:
-        return 0.0
-    coth = lambda x: math.cosh(x) / math.sinh(x) if x != 0 else float('inf')
-    if formula == 1:
-        return k0h * coth(k0h**(1.485/2)) ** (1/1.485)
-    elif formula == 2:
-        return k0h / math.tanh( k0h * (coth(k0h**(1.378/2)))**(1/1.378) )
-    elif formula == 3:
-        return k0h / math.tanh(math.sqrt(k0h) * (1.0 + math.sqrt(k0h)/(2.0 * math.pi)))
-    elif formula == 4:
-        return k0h * (1.0 + 1.0/(k0h**2))**0.25
-    elif formula == 5:
-        return k0h * ((coth(k0h**(1.434/2))) ** (1/1.434))
-    elif formula == 6:
-        return k0h / math.tanh(math.sqrt(math.sinh(k0h)))
-    elif formula == 7:
-        return k0h / ((1 - math.exp(-k0h**(2.445/2))) ** (1/2.445))
-    elif formula == 8:
-        return k0h / math.tanh(k0h * (coth(k0h**(1.310/2)))**(1/1.310))
-    elif formula == 9:
-        return k0h / math.tanh((1.1965**k0h)*math.sqrt(k0h))
-    elif formula == 10:
-        return k0h / math.tanh(k0h / (math.sqrt(math.tanh(math.sqrt(math.sinh(k0h)))) * math.tanh(k0h)**0.25))
-    else:
+    if not 1 <= formula <= len(_YAMAGUCHI_NONAKA):
         return -1
+    return _YAMAGUCHI_NONAKA[formula - 1](k0h)
 
+@njit(cache=True, fastmath=True)
 def Simarro_2013(k0h):
     """
     Simarro & Orfila (2013) two-step Newton-corrected approximation.
@@ -400,8 +1020,10 @@ def Simarro_2013(k0h):
     if k0h == 0:
         return 0.0
     kh_Beji = beji2013(k0h)
-    return (kh_Beji**2 + k0h * math.cosh(kh_Beji)**2) / (kh_Beji + math.sinh(kh_Beji) * math.cosh(kh_Beji))
+    cosh_B = math.cosh(kh_Beji)
+    return (kh_Beji * kh_Beji + k0h * cosh_B * cosh_B) / (kh_Beji + math.sinh(kh_Beji) * cosh_B)
 
+@njit(cache=True, fastmath=True)
 def vatankhah2013_1(k0h):
     """
     Vatankhah & Aghashariatmadari (2013) – Single-step explicit formula #2.
@@ -423,10 +1045,11 @@ def vatankhah2013_1(k0h):
     """
     if k0h == 0:
         return 0.0
-    partA = (k0h + k0h**2 * math.exp(-(3.2 + k0h**1.65))) / math.sqrt(math.tanh(k0h))
-    partB = k0h * (1 - math.exp(-k0h**0.132))**(5.0532 + 2.1584*(k0h**1.505))
+    partA = (k0h + k0h*k0h * math.exp(-(3.2 + k0h**1.65))) / math.sqrt(math.tanh(k0h))
+    partB = k0h * (-math.expm1(-k0h**0.132))**(5.0532 + 2.1584*(k0h**1.505))
     return partA + partB
 
+@njit(cache=True, fastmath=True)
 def vatankhah2013_2(k0h):
     """
     Vatankhah & Aghashariatmadari (2013) – Single-step explicit formula #1.
@@ -446,8 +1069,9 @@ def vatankhah2013_2(k0h):
     """
     if k0h == 0:
         return 0.0
-    return (k0h + k0h**2 * math.exp(-1.835 - 1.225 * k0h**1.35)) / math.sqrt(math.tanh(k0h))
+    return (k0h + k0h*k0h * math.exp(-1.835 - 1.225 * k0h**1.35)) / math.sqrt(math.tanh(k0h))
 
+@njit(cache=True, fastmath=True)
 def hunt1979_9(k0h):
     """
     Hunt (1979) Padé-type rational approximation for the dispersion relation.
@@ -471,11 +1095,12 @@ def hunt1979_9(k0h):
     Returns:
       float: Approximated nondimensional wavenumber, kh.
     """
-    coeffs = [0.6666666667, 0.3555, 0.16084, 0.0632, 0.02174,
-              0.00654, 0.00171, 0.00039, 0.00011]
-    s = sum(coeffs[i] * (k0h ** (i+1)) for i in range(len(coeffs)))
-    return math.sqrt(k0h**2 + k0h / (1 + s))
+    # c₁·k0h + … + c₉·k0h⁹ in Horner form (8 multiply-adds, no powers)
+    s = k0h * (0.6666666667 + k0h * (0.3555 + k0h * (0.16084 + k0h * (0.0632 + k0h * (0.02174
+        + k0h * (0.00654 + k0h * (0.00171 + k0h * (0.00039 + k0h * 0.00011))))))))
+    return math.sqrt(k0h * k0h + k0h / (1 + s))
 
+@njit(cache=True, fastmath=True)
 def hunt1979_5(k0h):
     """
     Hunt (1979) – 5th-order approximate solution (Hunt1) from Yamaguchi & Nonaka (2007).
@@ -497,9 +1122,12 @@ def hunt1979_5(k0h):
       float: Approximated nondimensional wavenumber (kₐ·h).
     """
     alpha = k0h
-    denom = 1.0 + 0.6522*alpha + 0.4622*(alpha**2) + 0.0864*(alpha**4) + 0.0675*(alpha**5)
+    # The α³ term is absent: the α⁴ and α⁵ terms share the factor α²·α²
+    a2 = alpha * alpha
+    denom = 1.0 + alpha * (0.6522 + alpha * 0.4622) + a2 * a2 * (0.0864 + alpha * 0.0675)
     return math.sqrt(alpha * (alpha + 1.0/denom))
 
+@njit(cache=True, fastmath=True)
 def fenton_mckee1990_1(k0h):
     """
     Fenton & McKee (1990) iterative-type approximation for kh, as described in Yamaguchi & Nonaka (2007).
@@ -524,8 +1152,10 @@ def fenton_mckee1990_1(k0h):
     Returns:
       float: Approximate nondimensional wavenumber, kh.
     """
+    if k0h == 0:
+        return 0.0
     alpha = k0h
-    beta_a = alpha * (math.cosh(alpha) / math.sinh(alpha))**0.5
+    beta_a = alpha / math.sqrt(math.tanh(alpha))  # α·coth(α)^½
     sech_beta_a = 1.0 / math.cosh(beta_a)
     tanh_beta_a = math.tanh(beta_a)
     beta_a_sq = beta_a * beta_a
@@ -534,6 +1164,7 @@ def fenton_mckee1990_1(k0h):
     denominator = tanh_beta_a + beta_a * sech_sq
     return numerator / denominator
 
+@njit(cache=True, fastmath=True)
 def fenton_mckee1990_2(k0h):
     """
     Fenton & McKee (1990) all-depth empirical approximation for kh.
@@ -557,8 +1188,12 @@ def fenton_mckee1990_2(k0h):
     Returns:
       float: Approximate nondimensional wavenumber, kh.
     """
-    return k0h / (math.tanh(k0h**(3/4))**(2/3))
+    if k0h == 0:
+        return 0.0
+    sqrt_k = math.sqrt(k0h)
+    return k0h / (math.tanh(sqrt_k * math.sqrt(sqrt_k))**(2/3))  # k0h^¾ = √k0h·k0h^¼
 
+@njit(cache=True, fastmath=True)
 def wu_thornton1986(k0h):
     """
     Wu & Thornton (1986) explicit approximation for the dispersion relation.
@@ -584,6 +1219,7 @@ def wu_thornton1986(k0h):
         y = k0h * (1 + 1.26 * math.exp(-1.84 * k0h))
         return k0h * (1 + 2 * math.exp(-2*y) * (1 + math.exp(-2*y)))
 
+@njit(cache=True, fastmath=True)
 def beji2013(k0h):
     """
     Beji (2013) improved explicit approximation.
@@ -603,8 +1239,9 @@ def beji2013(k0h):
     """
     if k0h == 0:
         return 0.0
-    return (k0h * (1 + k0h**1.09 * math.exp(-(1.55 + 1.30*k0h + 0.216*k0h**2)))) / math.sqrt(math.tanh(k0h))
+    return (k0h * (1 + k0h**1.09 * math.exp(-(1.55 + 1.30*k0h + 0.216*k0h*k0h)))) / math.sqrt(math.tanh(k0h))
 
+@njit(cache=True, fastmath=True)
 def nielsen1982(k0h):
     """
     Nielsen (1982) approximation for kh.
@@ -623,10 +1260,11 @@ def nielsen1982(k0h):
       float: Approximated nondimensional wavenumber, kh.
     """
     if k0h <= 2:
-        return math.sqrt(k0h) * math.sqrt(1 + (1/3)*k0h + (4/45)*k0h**2 + (16/945)*k0h**3)
+        return math.sqrt(k0h) * math.sqrt(1 + k0h*((1/3) + k0h*((4/45) + k0h*(16/945))))
     else:
         return k0h * (1 + 2 * math.exp(-2 * k0h))
 
+@njit(cache=True, fastmath=True)
 def you2002(k0h):
     """
     You solution for shallow water (from Yamaguchi & Nonaka (2007), Eq. (66)).
@@ -643,13 +1281,10 @@ def you2002(k0h):
     Returns:
       Approximated nondimensional wavenumber, kh.
     """
-    if k0h <= 2:
-        return math.sqrt(k0h) * math.sqrt(1 + (1/3) * k0h +
-                                          (4/45) * k0h**2 +
-                                          (16/945) * k0h**3)
-    else:
-        return k0h * (1 + 2 * math.exp(-2 * k0h))
+    # The same piecewise formula as Nielsen (1982)
+    return nielsen1982(k0h)
 
+@njit(cache=True, fastmath=True)
 def yu2014(k0h):
     """
     Yu (2014) explicit approximation using trigonometric identity.
@@ -671,9 +1306,12 @@ def yu2014(k0h):
     a = k0h
     if a == 0:
         return 0.0
-    term = 2.0 * (math.tanh(a) ** 2.5) - 1.0
-    return (a / math.sqrt(math.tanh(a))) + 0.0527 * math.sin(math.acos(term))
+    t = math.tanh(a)
+    sqrt_t = math.sqrt(t)
+    term = 2.0 * (t * t * sqrt_t) - 1.0  # tanh^2.5
+    return (a / sqrt_t) + 0.0527 * math.sin(math.acos(term))
 
+@njit(cache=True, fastmath=True)
 def gilbert2000(k0h):
     """
     Gilbert (circa 1989, publ. 2000) empirical approximation (USACE version).
@@ -697,6 +1335,7 @@ def gilbert2000(k0h):
     else:
         return k0h * (1 + 0.2 * math.exp(2 - 2 * k0h))
 
+@njit(cache=True, fastmath=True)
 def guo2002(k0h):
     """
     Guo (2002) explicit solution via logarithmic matching.
@@ -717,8 +1356,9 @@ def guo2002(k0h):
     if k0h == 0:
         return 0.0
     m = 2.4901
-    return k0h / ((1.0 - math.exp(-k0h**(m/2))) ** (1.0/m))
+    return k0h / ((-math.expm1(-k0h**(m/2))) ** (1.0/m))
 
+@njit(cache=True, fastmath=True)
 def guan2005(k0h):
     """
     Guan & Ju (2005) explicit formula.
@@ -737,6 +1377,7 @@ def guan2005(k0h):
     """
     return math.sqrt(k0h) * math.exp(-1.115 * k0h) + k0h * math.tanh(1.325 * math.sqrt(k0h))
 
+@njit(cache=True, fastmath=True)
 def iwagaki2007(k0h):
     """
     Iwagaki (1987) solution [Eq. (13) in Yamaguchi & Nonaka (2007)].
@@ -752,8 +1393,10 @@ def iwagaki2007(k0h):
     Returns:
       Approximated nondimensional wavenumber, kh (β_a).
     """
-    return k0h / math.tanh( math.sqrt(k0h) * (1.0 + math.sqrt(k0h)/(2.0*math.pi)) )
+    # The same formula as Yamaguchi & Nonaka's YN3
+    return _yamaguchi_nonaka_3(k0h)
 
+@njit(cache=True, fastmath=True)
 def eckart1951(k0h):
     """
     Eckart (1951/1990) early explicit approximation.
@@ -768,59 +1411,246 @@ def eckart1951(k0h):
     Returns:
       float: Approximated nondimensional wavenumber, kh.
     """
-    return k0h / (math.tanh(k0h)**0.5)
+    if k0h == 0:
+        return 0.0
+    return k0h / math.sqrt(math.tanh(k0h))
+
+# =============================================================================
+# ARRAY COUNTERPARTS (NumPy arrays of k0h)
+# =============================================================================
+#
+# The same formulas written with NumPy ufuncs, so that an error sweep evaluates each one over
+# the whole k0h grid at once.  The k0h == 0 guards of the scalar versions become np.where (the
+# discarded lanes may divide by zero or overflow, so the floating-point warnings are silenced);
+# their shallow/deep branches become np.piecewise, which evaluates each branch only on its own
+# points.  Only NumPy ufuncs are used on the arrays, so that tanh, exp, sinh, cosh, sqrt and
+# power run in NumPy's SIMD loops, and 1 - exp(-a) is written -expm1(-a), which keeps its
+# accuracy for small a.
+#
+# No GPU backend (CuPy / numba.cuda) is provided: the sweep is 10,000 points, which costs well
+# under a millisecond per method here, less than a host-device round trip.  Every counterpart is
+# an elementwise map followed by the row reductions of compute_error_table(), so a much finer
+# grid would port by swapping the array module.
+
+def _coth_vec(x):
+    return 1 / np.tanh(x)
+
+def _yamaguchi_nonaka_1_vec(k0h):
+    return k0h * _coth_vec(k0h**(1.485/2)) ** (1/1.485)
+
+def _yamaguchi_nonaka_2_vec(k0h):
+    return k0h / np.tanh(k0h * (_coth_vec(k0h**(1.378/2)))**(1/1.378))
+
+def _yamaguchi_nonaka_3_vec(k0h):
+    sqrt_k = np.sqrt(k0h)
+    return k0h / np.tanh(sqrt_k * (1.0 + sqrt_k/(2.0 * math.pi)))
+
+def _yamaguchi_nonaka_4_vec(k0h):
+    return k0h * np.sqrt(np.sqrt(1.0 + 1.0/(k0h*k0h)))
+
+def _yamaguchi_nonaka_5_vec(k0h):
+    return k0h * ((_coth_vec(k0h**(1.434/2))) ** (1/1.434))
+
+def _yamaguchi_nonaka_6_vec(k0h):
+    return k0h / np.tanh(np.sqrt(np.sinh(k0h)))
+
+def _yamaguchi_nonaka_7_vec(k0h):
+    return k0h / ((-np.expm1(-k0h**(2.445/2))) ** (1/2.445))
+
+def _yamaguchi_nonaka_8_vec(k0h):
+    return k0h / np.tanh(k0h * (_coth_vec(k0h**(1.310/2)))**(1/1.310))
+
+def _yamaguchi_nonaka_9_vec(k0h):
+    return k0h / np.tanh((1.1965**k0h)*np.sqrt(k0h))
+
+def _yamaguchi_nonaka_10_vec(k0h):
+    return k0h / np.tanh(k0h / np.sqrt(np.tanh(np.sqrt(np.sinh(k0h))) * np.sqrt(np.tanh(k0h))))
+
+_YAMAGUCHI_NONAKA_VEC = (
+    _yamaguchi_nonaka_1_vec, _yamaguchi_nonaka_2_vec, _yamaguchi_nonaka_3_vec, _yamaguchi_nonaka_4_vec,
+    _yamaguchi_nonaka_5_vec, _yamaguchi_nonaka_6_vec, _yamaguchi_nonaka_7_vec, _yamaguchi_nonaka_8_vec,
+    _yamaguchi_nonaka_9_vec, _yamaguchi_nonaka_10_vec,
+)
+
+def YamaguchiNonaka_vec(k0h, formula):
+    """Array counterpart of YamaguchiNonaka(); returns -1.0 when 'formula' is out of range."""
+    if not 1 <= formula <= len(_YAMAGUCHI_NONAKA_VEC):
+        return -1.0
+    k0h = np.asarray(k0h, dtype=float)
+    with np.errstate(all='ignore'):
+        kh = _YAMAGUCHI_NONAKA_VEC[formula - 1](k0h)
+    return np.where(k0h == 0, 0.0, kh)
+
+def beji2013_vec(k0h):
+    """Array counterpart of beji2013()."""
+    k0h = np.asarray(k0h, dtype=float)
+    with np.errstate(all='ignore'):
+        kh = (k0h * (1 + k0h**1.09 * np.exp(-(1.55 + 1.30*k0h + 0.216*k0h*k0h)))) / np.sqrt(np.tanh(k0h))
+    return np.where(k0h == 0, 0.0, kh)
+
+def Simarro_2013_vec(k0h):
+    """Array counterpart of Simarro_2013()."""
+    k0h = np.asarray(k0h, dtype=float)
+    kh_Beji = beji2013_vec(k0h)
+    with np.errstate(all='ignore'):
+        cosh_B = np.cosh(kh_Beji)
+        kh = (kh_Beji * kh_Beji + k0h * cosh_B * cosh_B) / (kh_Beji + np.sinh(kh_Beji) * cosh_B)
+    return np.where(k0h == 0, 0.0, kh)
+
+def vatankhah2013_1_vec(k0h):
+    """Array counterpart of vatankhah2013_1()."""
+    k0h = np.asarray(k0h, dtype=float)
+    with np.errstate(all='ignore'):
+        partA = (k0h + k0h*k0h * np.exp(-(3.2 + k0h**1.65))) / np.sqrt(np.tanh(k0h))
+        partB = k0h * (-np.expm1(-k0h**0.132))**(5.0532 + 2.1584*(k0h**1.505))
+    return np.where(k0h == 0, 0.0, partA + partB)
+
+def vatankhah2013_2_vec(k0h):
+    """Array counterpart of vatankhah2013_2()."""
+    k0h = np.asarray(k0h, dtype=float)
+    with np.errstate(all='ignore'):
+        kh = (k0h + k0h*k0h * np.exp(-1.835 - 1.225 * k0h**1.35)) / np.sqrt(np.tanh(k0h))
+    return np.where(k0h == 0, 0.0, kh)
+
+def hunt1979_9_vec(k0h):
+    """Array counterpart of hunt1979_9()."""
+    k0h = np.asarray(k0h, dtype=float)
+    s = k0h * (0.6666666667 + k0h * (0.3555 + k0h * (0.16084 + k0h * (0.0632 + k0h * (0.02174
+        + k0h * (0.00654 + k0h * (0.00171 + k0h * (0.00039 + k0h * 0.00011))))))))
+    return np.sqrt(k0h * k0h + k0h / (1 + s))
+
+def hunt1979_5_vec(k0h):
+    """Array counterpart of hunt1979_5()."""
+    alpha = np.asarray(k0h, dtype=float)
+    a2 = alpha * alpha
+    denom = 1.0 + alpha * (0.6522 + alpha * 0.4622) + a2 * a2 * (0.0864 + alpha * 0.0675)
+    return np.sqrt(alpha * (alpha + 1.0/denom))
+
+def fenton_mckee1990_1_vec(k0h):
+    """Array counterpart of fenton_mckee1990_1()."""
+    alpha = np.asarray(k0h, dtype=float)
+    with np.errstate(all='ignore'):
+        beta_a = alpha / np.sqrt(np.tanh(alpha))
+        cosh_b = np.cosh(beta_a)
+        sech_sq = 1.0 / (cosh_b * cosh_b)
+        kh = (alpha + beta_a * beta_a * sech_sq) / (np.tanh(beta_a) + beta_a * sech_sq)
+    return np.where(alpha == 0, 0.0, kh)
+
+def fenton_mckee1990_2_vec(k0h):
+    """Array counterpart of fenton_mckee1990_2()."""
+    k0h = np.asarray(k0h, dtype=float)
+    sqrt_k = np.sqrt(k0h)
+    with np.errstate(all='ignore'):
+        kh = k0h / (np.tanh(sqrt_k * np.sqrt(sqrt_k))**(2/3))
+    return np.where(k0h == 0, 0.0, kh)
+
+def wu_thornton1986_vec(k0h):
+    """Array counterpart of wu_thornton1986()."""
+    def deep(x):
+        e = np.exp(-2 * x * (1 + 1.26 * np.exp(-1.84 * x)))  # exp(-2y)
+        return x * (1 + 2 * e * (1 + e))
+    k0h = np.asarray(k0h, dtype=float)
+    return np.piecewise(k0h, [k0h <= 0.2 * 2 * math.pi],
+                        [lambda x: np.sqrt(x) * (1 + (x/6) * (1 + x/5)), deep])
+
+def nielsen1982_vec(k0h):
+    """Array counterpart of nielsen1982()."""
+    k0h = np.asarray(k0h, dtype=float)
+    return np.piecewise(k0h, [k0h <= 2],
+                        [lambda x: np.sqrt(x) * np.sqrt(1 + x*((1/3) + x*((4/45) + x*(16/945)))),
+                         lambda x: x * (1 + 2 * np.exp(-2 * x))])
+
+def you2002_vec(k0h):
+    """Array counterpart of you2002()."""
+    return nielsen1982_vec(k0h)
+
+def yu2014_vec(k0h):
+    """Array counterpart of yu2014()."""
+    a = np.asarray(k0h, dtype=float)
+    with np.errstate(all='ignore'):
+        t = np.tanh(a)
+        sqrt_t = np.sqrt(t)
+        term = 2.0 * (t * t * sqrt_t) - 1.0
+        kh = (a / sqrt_t) + 0.0527 * np.sin(np.arccos(term))
+    return np.where(a == 0, 0.0, kh)
+
+def gilbert2000_vec(k0h):
+    """Array counterpart of gilbert2000()."""
+    k0h = np.asarray(k0h, dtype=float)
+    return np.piecewise(k0h, [k0h <= 1],
+                        [lambda x: np.sqrt(x) * (1 + 0.2 * x),
+                         lambda x: x * (1 + 0.2 * np.exp(2 - 2 * x))])
+
+def guo2002_vec(k0h):
+    """Array counterpart of guo2002()."""
+    k0h = np.asarray(k0h, dtype=float)
+    m = 2.4901
+    with np.errstate(all='ignore'):
+        kh = k0h / ((-np.expm1(-k0h**(m/2))) ** (1.0/m))
+    return np.where(k0h == 0, 0.0, kh)
+
+def guan2005_vec(k0h):
+    """Array counterpart of guan2005()."""
+    k0h = np.asarray(k0h, dtype=float)
+    return np.sqrt(k0h) * np.exp(-1.115 * k0h) + k0h * np.tanh(1.325 * np.sqrt(k0h))
+
+def iwagaki2007_vec(k0h):
+    """Array counterpart of iwagaki2007()."""
+    return YamaguchiNonaka_vec(k0h, 3)
+
+def eckart1951_vec(k0h):
+    """Array counterpart of eckart1951()."""
+    k0h = np.asarray(k0h, dtype=float)
+    with np.errstate(all='ignore'):
+        kh = k0h / np.sqrt(np.tanh(k0h))
+    return np.where(k0h == 0, 0.0, kh)
 
 # =============================================================================
 # ORDERED APPROXIMATIONS (ALL FORMULAS ARE RANKED)
 # =============================================================================
+# The formula families map straight to their per-formula kernels, without a wrapper call that
+# re-dispatches on the formula number.  Every entry returns 0.0 at k0h == 0.
+#
+# The kernels keep libm's tanh/exp/sinh rather than cheaper rational approximations of them:
+# the table ranks the accuracy of the published formulas, and the best of them are within about
+# 1e-10 of kh_numeric, far below the error of any tanh approximation cheap enough to pay off
+# (Lambert's x·(27 + x²)/(27 + 9x²) is already 2% off at x = 1).
 ordered_approx = {
     "kh_numeric": kh_numeric,
 
-    "Pade(2025)_1": lambda x: pade2025(x, 1),
-    "Pade(2025)_2": lambda x: pade2025(x, 2),
-    "Pade(2025)_3": lambda x: pade2025(x, 3),
-    "Pade(2025)_4": lambda x: pade2025(x, 4),
-    "Pade(2025)_5": lambda x: pade2025(x, 5),
-    "Pade(2025)_6": lambda x: pade2025(x, 6),
-    "Pade(2025)_7": lambda x: pade2025(x, 7),
-    "Pade(2025)_8": lambda x: pade2025(x, 8),
-    "Pade(2025)_9": lambda x: pade2025(x, 9),
-    "Pade(2025)_10": lambda x: pade2025(x, 10),
-    "Pade(2025)_11": lambda x: pade2025(x, 11),
-    "Pade(2025)_12": lambda x: pade2025(x, 12),
-    "Pade(2025)_13": lambda x: pade2025(x, 13),
-
-    "Carvalho(2025)_1": lambda x: carvalho2025(x, 1),
-    "Carvalho(2025)_2": lambda x: carvalho2025(x, 2),
-    "Carvalho(2025)_3": lambda x: carvalho2025(x, 3),
-    "Carvalho(2025)_4": lambda x: carvalho2025(x, 4),
-    "Carvalho(2025)_5": lambda x: carvalho2025(x, 5),
-    "Carvalho(2025)_6": lambda x: carvalho2025(x, 6),
-    "Carvalho(2025)_7": lambda x: carvalho2025(x, 7),
-    "Carvalho(2025)_8": lambda x: carvalho2025(x, 8),
-    "Carvalho(2025)_9": lambda x: carvalho2025(x, 9),
-    "Carvalho(2025)_10": lambda x: carvalho2025(x, 10),
-    "Carvalho(2025)_11": lambda x: carvalho2025(x, 11),
-    "Carvalho(2025)_12": lambda x: carvalho2025(x, 12),
-    "Carvalho(2025)_13": lambda x: carvalho2025(x, 13),
-    "Carvalho(2025)_14": lambda x: carvalho2025(x, 14),
-    "Carvalho(2025)_15": lambda x: carvalho2025(x, 15),
-    "Carvalho(2025)_16": lambda x: carvalho2025(x, 16),
-    "Carvalho(2025)_17": lambda x: carvalho2025(x, 17),
-    "Carvalho(2025)_18": lambda x: carvalho2025(x, 18),
-    "Carvalho(2025)_19": lambda x: carvalho2025(x, 19),
-    "Carvalho(2025)_20": lambda x: carvalho2025(x, 20),
-
-    "Yamaguchi(2007)_1": lambda x: YamaguchiNonaka(x, 1),
-    "Yamaguchi(2007)_2": lambda x: YamaguchiNonaka(x, 2),
-    "Yamaguchi(2007)_3": lambda x: YamaguchiNonaka(x, 3),
-    "Yamaguchi(2007)_4": lambda x: YamaguchiNonaka(x, 4),
-    "Yamaguchi(2007)_5": lambda x: YamaguchiNonaka(x, 5),
-    "Yamaguchi(2007)_6": lambda x: YamaguchiNonaka(x, 6),
-    "Yamaguchi(2007)_7": lambda x: YamaguchiNonaka(x, 7),
-    "Yamaguchi(2007)_8": lambda x: YamaguchiNonaka(x, 8),
-    "Yamaguchi(2007)_9": lambda x: YamaguchiNonaka(x, 9),
-    "Yamaguchi(2007)_10": lambda x: YamaguchiNonaka(x, 10),
+    **{f"Pade(2025)_{formula}": func for formula, func in _PADE2025_DISPATCH.items()},
+
+    "Carvalho(2025)_1": _carvalho2025_1,
+    "Carvalho(2025)_2": _carvalho2025_2,
+    "Carvalho(2025)_3": _carvalho2025_3,
+    "Carvalho(2025)_4": _carvalho2025_4,
+    "Carvalho(2025)_5": _carvalho2025_5,
+    "Carvalho(2025)_6": _carvalho2025_6,
+    "Carvalho(2025)_7": _carvalho2025_7,
+    "Carvalho(2025)_8": _carvalho2025_8,
+    "Carvalho(2025)_9": _carvalho2025_9,
+    "Carvalho(2025)_10": _carvalho2025_10,
+    "Carvalho(2025)_11": _carvalho2025_11,
+    "Carvalho(2025)_12": _carvalho2025_12,
+    "Carvalho(2025)_13": _carvalho2025_13,
+    "Carvalho(2025)_14": _carvalho2025_14,
+    "Carvalho(2025)_15": _carvalho2025_15,
+    "Carvalho(2025)_16": _carvalho2025_16,
+    "Carvalho(2025)_17": _carvalho2025_17,
+    "Carvalho(2025)_18": _carvalho2025_18,
+    "Carvalho(2025)_19": _carvalho2025_19,
+    "Carvalho(2025)_20": _carvalho2025_20,
+
+    "Yamaguchi(2007)_1": _yamaguchi_nonaka_1,
+    "Yamaguchi(2007)_2": _yamaguchi_nonaka_2,
+    "Yamaguchi(2007)_3": _yamaguchi_nonaka_3,
+    "Yamaguchi(2007)_4": _yamaguchi_nonaka_4,
+    "Yamaguchi(2007)_5": _yamaguchi_nonaka_5,
+    "Yamaguchi(2007)_6": _yamaguchi_nonaka_6,
+    "Yamaguchi(2007)_7": _yamaguchi_nonaka_7,
+    "Yamaguchi(2007)_8": _yamaguchi_nonaka_8,
+    "Yamaguchi(2007)_9": _yamaguchi_nonaka_9,
+    "Yamaguchi(2007)_10": _yamaguchi_nonaka_10,
 
     "Beji(2013)": beji2013,
     "Eckart(1951)": eckart1951,
@@ -841,6 +1671,77 @@ ordered_approx = {
     "Vatankhah(2013)_2": vatankhah2013_2,
 }
 
+# Array counterparts of the entries above, used by compute_error_table() to evaluate each method
+# over the whole k0h grid in one call: the NumPy functions of the ARRAY COUNTERPARTS section, and
+# the compiled array kernels of the formula families.  They agree with the scalar kernels to
+# rounding (relative 1e-13 or better over the ranked k0h range).  Without numba, Carvalho(2025)
+# formulas other than 2 are the only rows still evaluated point by point (np.vectorize).
+ordered_approx_vec = {
+    "kh_numeric": kh_numeric_vec,
+    **{f"Pade(2025)_{n}": (lambda x, n=n: pade2025_batch(x, n)) for n in range(1, 14)},
+    **{f"Carvalho(2025)_{n}": (lambda x, n=n: carvalho2025_batch(x, n)) for n in range(1, 21)},
+    **{f"Yamaguchi(2007)_{n}": (lambda x, n=n: YamaguchiNonaka_vec(x, n)) for n in range(1, 11)},
+    "Beji(2013)": beji2013_vec,
+    "Eckart(1951)": eckart1951_vec,
+    "Fenton&McKee(1990)_1": fenton_mckee1990_1_vec,
+    "Fenton&McKee(1990)_2": fenton_mckee1990_2_vec,
+    "Gilbert(2000)": gilbert2000_vec,
+    "Guo(2002)": guo2002_vec,
+    "Guan&Ju(2005)": guan2005_vec,
+    "Hunt(1979)_5": hunt1979_5_vec,
+    "Hunt(1979)_9": hunt1979_9_vec,
+    "Iwagaki(2007)": iwagaki2007_vec,
+    "Nielsen(1982)": nielsen1982_vec,
+    "Simarro&Orfila(2013)": Simarro_2013_vec,
+    "Wu&Thornton(1986)": wu_thornton1986_vec,
+    "You(2002)": you2002_vec,
+    "Yu(2014)": yu2014_vec,
+    "Vatankhah(2013)_1": vatankhah2013_1_vec,
+    "Vatankhah(2013)_2": vatankhah2013_2_vec,
+}
+
+def _eval_all_methods_codegen(funcs):
+    # Generate one parallel kernel that evaluates every scalar method of 'funcs' at each point:
+    #     for j in prange(n): x = k0h[j]; out[0, j] = f0(x); out[1, j] = f1(x); ...
+    # The per-formula kernels are called from it rather than copied into its source; LLVM then
+    # inlines them into the loop body (inspect_llvm() of a fresh compile leaves calls only to
+    # kh_numeric and two Pade(2025) formulas), so each point is loaded once for all methods.
+    # The prange runs over points rather than methods.  A prange over methods (one branch per
+    # method index, each looping over all the points) fills the same matrix in the same
+    # single-thread time, but numba cuts the range into equal blocks: a block of iterative
+    # methods then outlasts the rest, whereas a block of points carries every formula once.
+    # The source is compiled under this file's name, so that numba caches the kernel on disk
+    # like the others and compiles it again whenever this file, and so 'funcs', changes.
+    namespace = {"prange": prange, "__name__": __name__}
+    lines = ["def _eval_all_methods_kernel(k0h, out):", "    for j in prange(k0h.size):", "        x = k0h[j]"]
+    for i, func in enumerate(funcs.values()):
+        namespace[f"f{i}"] = func
+        lines.append(f"        out[{i}, j] = f{i}(x)")
+    exec(compile("\n".join(lines) + "\n", __file__, "exec"), namespace)
+    return njit(parallel=True, cache=True, fastmath=True)(namespace["_eval_all_methods_kernel"])
+
+# Fused kernel over ordered_approx, generated once from the methods defined in this file (the
+# disk cache is only valid for those); numba compiles it, or loads it from the cache, on first use.
+_eval_all_methods_kernel = _eval_all_methods_codegen(ordered_approx) if HAVE_NUMBA else None
+
+def eval_all_methods(k0h_vals):
+    """
+    Evaluate every method of ordered_approx over an array of k0h in one pass.
+
+    With numba, a single compiled kernel fills all the rows point by point, with the points
+    spread over threads; it evaluates the same scalar kernels that main() times.  Without numba,
+    the rows are the ordered_approx_vec counterparts.
+
+    Returns:
+      numpy.ndarray of shape (len(ordered_approx), len(k0h_vals)), rows in ordered_approx order.
+    """
+    k0h_vals = np.ascontiguousarray(k0h_vals, dtype=float).reshape(-1)
+    if _eval_all_methods_kernel is None:
+        return np.stack([ordered_approx_vec[name](k0h_vals) for name in ordered_approx])
+    out = np.empty((len(ordered_approx), k0h_vals.size))
+    _eval_all_methods_kernel(k0h_vals, out)
+    return out
+
 # =============================================================================
 # ERROR ANALYSIS
 # =============================================================================
@@ -910,37 +1811,118 @@ ordered_approx = {
 #   60    Iwagaki(2007)           1.4889834%   3.1473467%    1.8060        0.62
 #   61    Yamaguchi(2007)_4       1.5872652%   3.1772841%    0.4268        0.73
 
-def compute_errors(func, k0h_vals):
+def error_statistics(approx_vals, k0h_vals, exact_vals):
+    """
+    Average and maximum absolute relative errors (%) of precomputed approximations.
+
+    'approx_vals' holds approximations at k0h_vals along its last axis: one method as a 1-D
+    array, or a stacked (M, N) matrix such as the one built by compute_error_table(), which is
+    reduced row by row in a single broadcast.
+
+    Returns:
+      (average_error, maximum_error, k0h_max), scalars or length-M arrays.
+    """
+    abs_exact = np.abs(exact_vals)
+    errors = np.where(abs_exact == 0, 0.0,
+                      100.0 * np.abs(approx_vals - exact_vals) / np.where(abs_exact == 0, 1.0, abs_exact))
+    idx_max = errors.argmax(axis=-1)
+    max_errors = np.take_along_axis(errors, idx_max[..., np.newaxis], axis=-1)[..., 0]
+    return errors.mean(axis=-1), max_errors[()], k0h_vals[idx_max]
+
+def compute_errors(func, k0h_vals, exact_vals=None, reference=kh_numeric_vec, vectorized=False):
     """
     For a given approximation function 'func' and an array of k0h values,
     compute the average and maximum absolute relative errors (%) compared
     to the exact solution 'kh_numeric'.
 
+    With vectorized=True, 'func' is an array function, such as an entry of ordered_approx_vec,
+    and is called once with the whole array.  Otherwise (default) it is a scalar function, such
+    as an entry of ordered_approx, and is called point by point.
+    'exact_vals' optionally supplies kh_numeric at k0h_vals, so that a sweep over
+    many methods solves for the reference only once. Otherwise it is computed with
+    'reference': kh_numeric_vec (default) or the table-seeded kh_numeric_fast.
+
     Absolute relative error (%) = 100 * |approx - exact| / |exact|
 
     Returns:
       (average_error, maximum_error, k0h_max)
       where k0h_max is the k0h value at which the maximum error occurs.
     """
-    errors = []
-    for val in k0h_vals:
-        exact_kh = kh_numeric(val)
-        approx_kh = func(val)
-        if exact_kh == 0:
-            err = 0.0
-        else:
-            err = 100.0 * abs(approx_kh - exact_kh) / abs(exact_kh)
-        errors.append(err)
-    avg_error = np.mean(errors)
-    max_error = max(errors)
-    idx_max = errors.index(max_error)
-    k0h_max = k0h_vals[idx_max]
-    return avg_error, max_error, k0h_max
+    if exact_vals is None:
+        exact_vals = reference(k0h_vals)
+    k0h_vals = np.asarray(k0h_vals, dtype=float)
+    if vectorized:
+        approx_vals = np.asarray(func(k0h_vals), dtype=float)
+    else:
+        approx_vals = np.fromiter(map(func, k0h_vals), dtype=float, count=k0h_vals.size)
+    return error_statistics(approx_vals, k0h_vals, exact_vals)
+
+def compute_error_table(funcs, k0h_vals, exact_vals=None, reference=kh_numeric_vec, vectorized=True):
+    """
+    Error statistics for several approximations at once.
+
+    Every entry of 'funcs' (a mapping name -> function) is evaluated into one row of an (M, N)
+    matrix, and the relative errors (%) against 'exact_vals' are reduced
+    row-wise by error_statistics(). A method that raises, or does not return one value per
+    point, gets a zero-error row, flagged in 'ok', and its message is printed. 'exact_vals' and
+    'reference' are as in compute_errors().
+
+    With funcs=None the rows are all the methods of ordered_approx, evaluated together by
+    eval_all_methods(): one compiled pass over the grid, spread over every CPU core.  A mapping
+    is evaluated one method at a time: with vectorized=True (default) its entries are array
+    functions, such as those of ordered_approx_vec, and each row is a single call; with
+    vectorized=False they are scalar functions, such as those of ordered_approx, called point
+    by point as in compute_errors().  (Rows are not spread
+    over Python threads: the compiled kernels among them already run on all cores, and numba's
+    fallback workqueue threading layer is not safe to enter from several threads at once.)
+
+    Returns:
+      (avg_errors, max_errors, k0h_max, ok)
+      four length-M arrays; ok[i] is False where method i raised.
+    """
+    if exact_vals is None:
+        exact_vals = reference(k0h_vals)
+    if funcs is None:
+        approx = eval_all_methods(k0h_vals)
+        return error_statistics(approx, k0h_vals, exact_vals) + (np.ones(len(approx), dtype=bool),)
+    approx = np.empty((len(funcs), len(k0h_vals)))
+    ok = np.ones(len(funcs), dtype=bool)
+    for i, (name, func) in enumerate(funcs.items()):
+        try:
+            if vectorized:
+                row = np.asarray(func(k0h_vals), dtype=float)
+            else:
+                row = np.fromiter(map(func, k0h_vals), dtype=float, count=len(k0h_vals))
+            if row.shape != approx[i].shape:
+                raise ValueError(f"expected {approx[i].shape[0]} values, got shape {row.shape}")
+            approx[i] = row
+        except Exception as exc:
+            ok[i] = False
+            approx[i] = exact_vals
+            print(f"Error computing {name}: {exc}")
+    return error_statistics(approx, k0h_vals, exact_vals) + (ok,)
+
+def time_per_call(func, x, repeat=5, max_time=0.02):
+    """
+    Time in seconds of one call func(x), for scalar approximations such as ordered_approx entries.
+
+    timeit.Timer runs the calls as deque(map(func, repeat(x, n)), maxlen=0), a loop entirely in
+    C, so the measurement carries no per-call bytecode of its own, and switches the garbage
+    collector off meanwhile.  n is chosen once: 100 calls estimate the cost of one, and n is
+    then the number of calls that fills max_time / repeat seconds.  Timer.repeat() runs the loop
+    'repeat' times and the fastest run is kept, since slower runs only add interruptions by
+    other processes; the whole measurement thus takes about 'max_time' seconds per method.
+    The first call (numba compilation or cache loading) should be made beforehand.
+    """
+    def timer(n):
+        return timeit.Timer(lambda: deque(map(func, itertools.repeat(x, n)), maxlen=0))
+    n = max(1, int(max_time / repeat / max(timer(100).timeit(1) / 100, 1e-9)))
+    return min(timer(n).repeat(repeat, 1)) / n
 
 # =============================================================================
 # MAIN DRIVER
 # =============================================================================
-def main():
+def main(reference=kh_numeric_vec, annotations=True):
     """
     Main driver function to:
       - Evaluate each dispersion approximation method over k0h in [0.0001, 2π] using 10,000 points.
@@ -953,69 +1935,61 @@ def main():
       - Sort methods by average relative error (primary) and maximum relative error (secondary).
       - Print a ranking table with detailed error statistics and write it to wave-disp-equation_output.txt.
       - Plot a chart comparing the average errors of all approximation methods.
+
+    'reference' computes the exact solution over the grid: kh_numeric_vec (default) or
+    kh_numeric_fast, which agree to double precision. With annotations=False the chart is drawn
+    without the explanatory text and equation.
     """
     k0h_vals = np.linspace(0.0001, 2 * math.pi, 10000)
-    results = []
-    for name, func in ordered_approx.items():
+    exact_vals = reference(k0h_vals)
+    avg_errors, max_errors, k0h_maxs, ok = compute_error_table(
+        ordered_approx_vec, k0h_vals, exact_vals)
+    # Every method is timed at the same k0h, drawn once from a seeded generator so that the
+    # timings are comparable across methods and reproducible across runs
+    random_k0h = float(np.random.default_rng(0).uniform(0.0001, 2*math.pi))
+    # One record per method; NaN marks a value that could not be computed
+    results = np.empty(len(ordered_approx), dtype=[('name', 'U32'), ('avg', float), ('max', float),
+                                                   ('k0h_max', float), ('t1m', float)])
+    results['name'] = list(ordered_approx)
+    results['avg'] = np.where(ok, avg_errors, np.nan)
+    results['max'] = np.where(ok, max_errors, np.nan)
+    results['k0h_max'] = np.where(ok, k0h_maxs, np.nan)
+    for i, (name, func) in enumerate(ordered_approx.items()):
         try:
-            avg_e, max_e, k0h_max = compute_errors(func, k0h_vals)
+            func(random_k0h)  # compile (or load from numba's cache) outside the timed loop
+            results['t1m'][i] = 1e6 * time_per_call(func, random_k0h)
         except Exception as exc:
-            avg_e, max_e, k0h_max = None, None, None
-            print(f"Error computing {name}: {exc}")
-        try:
-            random_k0h = np.random.uniform(0.0001, 2*math.pi)
-            start = time.perf_counter()
-            for _ in range(1000):
-                func(random_k0h)
-            end = time.perf_counter()
-            time1m = 1000*(end - start)
-        except Exception as exc:
-            time1m = None
+            results['t1m'][i] = np.nan
             print(f"Error timing {name}: {exc}")
-        results.append((name, avg_e, max_e, k0h_max, time1m))
 
-    results_sorted = sorted(
-        results,
-        key=lambda x: (float('inf') if x[1] is None else x[1],
-                       float('inf') if x[2] is None else x[2])
-    )
+    # Rank by average error, then maximum error (np.lexsort takes the primary key last); the sort
+    # is stable and puts the methods whose errors could not be computed (NaN) at the end
+    results_sorted = results[np.lexsort((results['max'], results['avg']))]
 
     header = "Approximation Errors (absolute %, relative to kh_numeric) for k0h in [0.0001, 2π]\n\n"
     header += f"{'Rank':4s} {'Method':17s} {'AvgErr':>12s} {'MaxErr':>12s} {'k0h_MaxErr':>17s} {'Time1M':>7s}"
-    lines = [header]
-    for idx, (meth, av, mx, k0h_max, t1m) in enumerate(results_sorted, start=1):
-        if av is None:
-            line = (
-                f"{idx:4d} "
-                f"{meth:20s} "
-                f"{'ERROR':>12s}"
-                f"{'':>13s} "
-                f"{'':>10s} "
-                f"{'':>10s}"
-            )
-        else:
-            line = (
-                f"{idx:4d} "
-                f"{meth:20s} "
-                f"{av:12.7f}%"
-                f"{mx:12.7f}%"
-                f"{k0h_max:10.4f}"
-                f"{t1m:10.2f}"
-            )
-        lines.append(line)
+    # Row templates, filled from the fields of each record (ERROR rows keep the column widths)
+    row_template = "{idx:4d} {name:20s} {avg:12.7f}%{max:12.7f}%{k0h_max:10.4f}{t1m:10.2f}"
+    error_template = "{idx:4d} {name:20s} " + "ERROR".rjust(12) + " " * 35
+    # The table has one line per method after the header, so row 'idx' goes to lines[idx]
+    lines = [header] + [None] * len(results_sorted)
+    for idx, record in enumerate(results_sorted, start=1):
+        fields = dict(zip(results_sorted.dtype.names, record.item()), idx=idx)
+        template = error_template if np.isnan(fields['avg']) else row_template
+        lines[idx] = template.format_map(fields)
+    # One string serves both the console and the file
     output_str = "\n".join(lines)
     print(output_str)
-    with open("wave-disp-equation_output.txt", "w", encoding="utf-8") as f:
-        f.write(output_str)
+    Path("wave-disp-equation_output.txt").write_text(output_str, encoding="utf-8")
 
     # =============================================================================
     # PLOTTING: Plot a chart of average absolute error (%) for each method
     # =============================================================================
 
     # Filter out methods with valid error values
-    valid_results = [r for r in results_sorted if r[1] is not None]
-    methods = [r[0] for r in valid_results]
-    avg_errors = [r[1] for r in valid_results]
+    valid_results = results_sorted[~np.isnan(results_sorted['avg'])]
+    methods = list(valid_results['name'])
+    avg_errors = valid_results['avg']
 
     # Create a figure
     plt.figure(figsize=(16, 8))
@@ -1023,8 +1997,10 @@ def main():
     # Create bar plot
     bars = plt.bar(methods, avg_errors, color='skyblue', edgecolor='black')
 
-    # Set the y-axis major ticks to have a step of 0.1
-    plt.yticks(np.arange(0, max(avg_errors)+0.1, 0.1))
+    # Set the y-axis major ticks to have a step of 0.1 (the errors are sorted, so the largest is
+    # the last one; with no valid method the default ticks are kept)
+    if avg_errors.size:
+        plt.yticks(np.arange(0, avg_errors[-1] + 0.1, 0.1))
 
     # Add labels and title
     plt.xlabel('Approximation Method', fontsize=12)
@@ -1040,31 +2016,29 @@ def main():
     # Optional: Add gridlines for better readability
     plt.grid(axis='both', which='major', linestyle='--', linewidth=1.5, alpha=0.7)  # Main x and y gridlines
 	
-    # Adding vertical data value labels on top of the bars
-    for i, bar in enumerate(bars):
-        yval = bar.get_height()
-        # Choose the format based on the index
-        if i < 56:
-            plt.text(bar.get_x() + bar.get_width()/2, yval + 0.01, f"{yval:.15f}%", ha='center', va='bottom', rotation=90,color='red')
-        else:
-            plt.text(bar.get_x() + bar.get_width()/2, yval + 0.01, f"{yval:.3f}%", ha='center', va='bottom', rotation=90,color='red')
-
-    # Text to be added at the top
-    explanatory_text = (
-        "The linear wave dispersion equation relates wave frequency (or period) to wavenumber and water depth\n\n"
-        "\n\n\nwhere:\n\n"
-        "    - ω (omega) is the angular frequency (ω = 2π/T, T = wave period),\n"
-        "    - k is the wavenumber (k = 2π/L, L = wavelength),\n"
-        "    - index 0 = offshore conditions (k₀ = 2π/L₀, L₀ = gT²/(2π)),\n"
-        "    - h is the water depth,\n"
-        "    - g is the gravitational acceleration."
-    )
-
-    # Adding the explanatory text at the top of the chart
-    plt.text(0.45, 0.95, explanatory_text, ha='center', va='top', fontsize=12, fontweight='normal', transform=plt.gca().transAxes)
-
-    # Now adding the bold equation separately
-    plt.text(0.5, 0.90, "\nω² = g · k · tanh(k · h)   or   k₀ · h = k · h · tanh(k · h)", ha='center', va='top', fontsize=14, fontweight='bold', transform=plt.gca().transAxes)
+    # Adding vertical data value labels on top of the bars, in one call; the format is chosen by
+    # index (full precision for the small errors of the leading methods)
+    labels = [f"{yval:.15f}%" if i < 56 else f"{yval:.3f}%" for i, yval in enumerate(avg_errors)]
+    plt.gca().bar_label(bars, labels=labels, padding=3, rotation=90, color='red')
+
+    # The explanation of the dispersion equation is left out of batch runs (--batch)
+    if annotations:
+        # Text to be added at the top
+        explanatory_text = (
+            "The linear wave dispersion equation relates wave frequency (or period) to wavenumber and water depth\n\n"
+            "\n\n\nwhere:\n\n"
+            "    - ω (omega) is the angular frequency (ω = 2π/T, T = wave period),\n"
+            "    - k is the wavenumber (k = 2π/L, L = wavelength),\n"
+            "    - index 0 = offshore conditions (k₀ = 2π/L₀, L₀ = gT²/(2π)),\n"
+            "    - h is the water depth,\n"
+            "    - g is the gravitational acceleration."
+        )
+
+        # Adding the explanatory text at the top of the chart
+        plt.text(0.45, 0.95, explanatory_text, ha='center', va='top', fontsize=12, fontweight='normal', transform=plt.gca().transAxes)
+
+        # Now adding the bold equation separately
+        plt.text(0.5, 0.90, "\nω² = g · k · tanh(k · h)   or   k₀ · h = k · h · tanh(k · h)", ha='center', va='top', fontsize=14, fontweight='bold', transform=plt.gca().transAxes)
 
     # Adjust the margins to reduce blank space
     plt.subplots_adjust(left=0.05, right=0.95)
@@ -1072,11 +2046,16 @@ def main():
     # Ensure layout is tight
     plt.tight_layout()
 
-    # Save the figure
+    # Save the figure (a PNG is always drawn by Agg, whatever the display backend, and without a
+    # display matplotlib already falls back to Agg, for which plt.show() below does nothing)
     plt.savefig("wave-disp-equation_errors.png", dpi=300, bbox_inches='tight')
 
     # Show the plot
     plt.show()
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Rank the explicit approximations of the wave dispersion equation.")
+    parser.add_argument("--batch", "--no-annotations", dest="no_annotations", action="store_true",
+                        help="leave the explanatory text and equation out of the chart")
+    args = parser.parse_args()
+    main(annotations=not args.no_annotations)